@@ -44,8 +44,8 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run the LunaQt2 window")
     parser.add_argument(
         "--mode",
-        choices=[mode.value for mode in ThemeMode],
-        default=DEFAULT_THEME_MODE.value,
+        choices=[mode.name.lower() for mode in ThemeMode],
+        default=DEFAULT_THEME_MODE.name.lower(),
         help="Theme mode to use when applying the stylesheet",
     )
     return parser.parse_args()
@@ -53,7 +53,7 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
-    mode = ThemeMode(args.mode)
+    mode = ThemeMode[args.mode.upper()]
     ui_font_point_size = clamp_ui_font_point_size(DEFAULT_UI_FONT_POINT_SIZE)
     default_ui_family = AVAILABLE_UI_FONT_FAMILIES[0]
     style_preferences = StylePreferences(
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Dict, List, Sequence, Set
 
-from core.models import Cell, Notebook, NotebookState
+from core.models import Cell, Notebook, NotebookHeader, NotebookState
+from core.models._timestamps import format_timestamp
 from core.persistence import DataStore
 from shared.utils.id_generator import generate_notebook_id
 
@@ -30,6 +33,10 @@ class NotebookManager:
         self._store = store
         self._cell_manager = cell_manager
         self._states: Dict[str, NotebookState] = {}
+        # Reverse index of cell_id -> ids of loaded notebooks holding that cell
+        self._cell_to_notebooks: Dict[str, Set[str]] = {}
+        # Content digest (ignoring modified_at) of what is known to be on disk
+        self._clean_hashes: Dict[str, bytes] = {}
         self._active_notebook_id: str | None = None
         self.events = events or NotebookEvents()
 
@@ -57,7 +64,8 @@ class NotebookManager:
             modified_at=now,
         )
 
-        self._store.save_notebook(notebook.to_payload())
+        if self._store.save_notebook(notebook.to_payload()):
+            self._mark_clean(notebook)
         state = NotebookState(notebook=notebook, cells={})
         self._states[notebook_id] = state
         self._active_notebook_id = notebook_id
@@ -92,10 +100,16 @@ class NotebookManager:
         if not state:
             return False
 
-        notebook = state.notebook.copy_with(modified_at=datetime.now(timezone.utc))
+        self._prune_missing_cells(state)
+        if self._clean_hashes.get(notebook_id) == _notebook_digest(state.notebook):
+            return True
+
+        now = datetime.now(timezone.utc)
+        notebook = state.notebook.copy_with(modified_at=now)
         state.with_notebook(notebook)
         persisted = self._store.save_notebook(notebook.to_payload())
         if persisted:
+            self._mark_clean(notebook)
             self.events.state_updated.emit(state)
         return persisted
 
@@ -116,17 +130,22 @@ class NotebookManager:
         insert_position = position if position is not None else len(state.notebook.cell_ids)
         insert_position = max(0, min(insert_position, len(state.notebook.cell_ids)))
 
+        now = datetime.now(timezone.utc)
         cell_ids = list(state.notebook.cell_ids)
         cell_ids.insert(insert_position, cell.cell_id)
 
         notebook = state.notebook.copy_with(
             cell_ids=cell_ids,
-            modified_at=datetime.now(timezone.utc),
+            modified_at=now,
         )
 
         state.with_notebook(notebook)
         state.set_cell(cell)
-        self._store.save_notebook(notebook.to_payload())
+        self._index_cell(notebook_id, cell.cell_id)
+        self._persist_op(
+            notebook,
+            {"op": "insert", "cell_id": cell.cell_id, "position": insert_position},
+        )
 
         self.events.cell_added.emit(notebook_id, cell.cell_id, insert_position)
         self.events.state_updated.emit(state)
@@ -140,15 +159,17 @@ class NotebookManager:
         if cell_id not in state.notebook.cell_ids:
             return False
 
+        now = datetime.now(timezone.utc)
         cell_ids = [cid for cid in state.notebook.cell_ids if cid != cell_id]
         notebook = state.notebook.copy_with(
             cell_ids=cell_ids,
-            modified_at=datetime.now(timezone.utc),
+            modified_at=now,
         )
 
         state.with_notebook(notebook)
         state.remove_cell(cell_id)
-        self._store.save_notebook(notebook.to_payload())
+        self._unindex_cell(notebook_id, cell_id)
+        self._persist_op(notebook, {"op": "remove", "cell_id": cell_id})
 
         self.events.cell_removed.emit(notebook_id, cell_id)
         self.events.state_updated.emit(state)
@@ -162,17 +183,21 @@ class NotebookManager:
         if cell_id not in state.notebook.cell_ids:
             return False
 
+        now = datetime.now(timezone.utc)
         cell_ids = [cid for cid in state.notebook.cell_ids if cid != cell_id]
         new_position = max(0, min(new_position, len(cell_ids)))
         cell_ids.insert(new_position, cell_id)
 
         notebook = state.notebook.copy_with(
             cell_ids=cell_ids,
-            modified_at=datetime.now(timezone.utc),
+            modified_at=now,
         )
 
         state.with_notebook(notebook)
-        self._store.save_notebook(notebook.to_payload())
+        self._persist_op(
+            notebook,
+            {"op": "move", "cell_id": cell_id, "position": new_position},
+        )
 
         self.events.cell_moved.emit(notebook_id, cell_id, new_position)
         self.events.state_updated.emit(state)
@@ -181,11 +206,19 @@ class NotebookManager:
     # ------------------------------------------------------------------
     # Lookup helpers
     # ------------------------------------------------------------------
-    def get_cell_order(self, notebook_id: str) -> List[str]:
+    def get_cell_order(self, notebook_id: str) -> Sequence[str]:
+        state = self._ensure_state(notebook_id)
+        if not state:
+            return ()
+        return state.cell_order()
+
+    def get_cell_lazy(self, notebook_id: str, cell_id: str) -> Cell | None:
+        """Return a notebook cell, loading it from the store on first access."""
+
         state = self._ensure_state(notebook_id)
         if not state:
-            return []
-        return list(state.notebook.cell_ids)
+            return None
+        return state.get_cell(cell_id)
 
     def get_active_notebook_id(self) -> str | None:
         return self._active_notebook_id
@@ -197,6 +230,12 @@ class NotebookManager:
         payloads = self._store.list_notebooks()
         return [Notebook.from_payload(payload) for payload in payloads]
 
+    def list_notebook_headers(self) -> List[NotebookHeader]:
+        """Return lightweight listing entries without loading full notebooks."""
+
+        headers = self._store.list_notebook_headers()
+        return [NotebookHeader.from_payload(header) for header in headers]
+
     def rename_notebook(self, notebook_id: str, new_title: str) -> Notebook | None:
         new_title = new_title.strip()
         if not new_title:
@@ -206,13 +245,15 @@ class NotebookManager:
         if not state:
             return None
 
+        now = datetime.now(timezone.utc)
         notebook = state.notebook.copy_with(
             title=new_title,
-            modified_at=datetime.now(timezone.utc),
+            modified_at=now,
         )
 
         state.with_notebook(notebook)
-        self._store.save_notebook(notebook.to_payload())
+        if self._store.save_notebook(notebook.to_payload()):
+            self._mark_clean(notebook)
 
         self.events.notebook_renamed.emit(notebook)
         self.events.state_updated.emit(state)
@@ -224,7 +265,11 @@ class NotebookManager:
 
         deleted = self._store.delete_notebook(notebook_id)
         if deleted:
-            self._states.pop(notebook_id, None)
+            self._clean_hashes.pop(notebook_id, None)
+            state = self._states.pop(notebook_id, None)
+            if state is not None:
+                for cell_id in state.cells.keys() | set(state.notebook.cell_ids):
+                    self._unindex_cell(notebook_id, cell_id)
             if self._active_notebook_id == notebook_id:
                 self._active_notebook_id = None
             self.events.notebook_deleted.emit(notebook_id)
@@ -244,47 +289,103 @@ class NotebookManager:
         if not payload:
             return None
 
+        # Cells are fetched on first access; ids that no longer resolve are
+        # pruned from the notebook on the next save. Every listed id is indexed
+        # up front so cell events reach cells that were never read.
         notebook = Notebook.from_payload(payload)
-        valid_cell_ids: list[str] = []
-        cells = {}
+        self._mark_clean(notebook)
         for cell_id in notebook.cell_ids:
-            cell = self._cell_manager.get_cell(cell_id)
-            if cell and cell.deleted_at is None:
-                cells[cell_id] = cell
-                valid_cell_ids.append(cell_id)
-
-        if valid_cell_ids != list(notebook.cell_ids):
-            notebook = notebook.copy_with(
-                cell_ids=valid_cell_ids,
-                modified_at=datetime.now(timezone.utc),
-            )
-            self._store.save_notebook(notebook.to_payload())
-
-        state = NotebookState(notebook=notebook, cells=cells)
+            self._index_cell(notebook_id, cell_id)
+        state = NotebookState(
+            notebook=notebook,
+            cell_loader=self._fetch_cell,
+        )
         self._states[notebook_id] = state
         return state
 
+    def _fetch_cell(self, cell_id: str) -> Cell | None:
+        cell = self._cell_manager.get_cell(cell_id)
+        if cell is None or cell.deleted_at is not None:
+            return None
+        return cell
+
+    def _prune_missing_cells(self, state: NotebookState) -> None:
+        missing = state.missing_cell_ids()
+        if not missing:
+            return
+
+        cell_ids = [cid for cid in state.notebook.cell_ids if cid not in missing]
+        notebook = state.notebook.copy_with(
+            cell_ids=cell_ids,
+            modified_at=datetime.now(timezone.utc),
+        )
+        state.with_notebook(notebook)
+
+    def _index_cell(self, notebook_id: str, cell_id: str) -> None:
+        self._cell_to_notebooks.setdefault(cell_id, set()).add(notebook_id)
+
+    def _unindex_cell(self, notebook_id: str, cell_id: str) -> None:
+        notebook_ids = self._cell_to_notebooks.get(cell_id)
+        if notebook_ids is None:
+            return
+        notebook_ids.discard(notebook_id)
+        if not notebook_ids:
+            del self._cell_to_notebooks[cell_id]
+
+    def _persist_op(self, notebook: Notebook, op: dict) -> None:
+        """Log an ordering change, falling back to a full checkpoint on failure."""
+
+        op["modified_at"] = format_timestamp(notebook.modified_at)
+        # The next save_notebook should fold the log into a fresh checkpoint.
+        self._clean_hashes.pop(notebook.notebook_id, None)
+        if not self._store.append_notebook_op(notebook.notebook_id, op):
+            if self._store.save_notebook(notebook.to_payload()):
+                self._mark_clean(notebook)
+
+    def _mark_clean(self, notebook: Notebook) -> None:
+        self._clean_hashes[notebook.notebook_id] = _notebook_digest(notebook)
+
     def _handle_cell_updated(self, cell: Cell) -> None:
-        for state in self._states.values():
-            if cell.cell_id in state.cells:
+        for notebook_id in tuple(self._cell_to_notebooks.get(cell.cell_id, ())):
+            state = self._states.get(notebook_id)
+            if state is not None and _holds_cell(state, cell.cell_id):
                 state.set_cell(cell)
                 self.events.state_updated.emit(state)
 
     def _handle_cell_deleted(self, cell_id: str) -> None:
-        for notebook_id, state in list(self._states.items()):
-            if cell_id in state.cells:
-                state.remove_cell(cell_id)
-                if cell_id in state.notebook.cell_ids:
-                    cell_ids = [cid for cid in state.notebook.cell_ids if cid != cell_id]
-                    notebook = state.notebook.copy_with(
-                        cell_ids=cell_ids,
-                        modified_at=datetime.now(timezone.utc),
-                    )
-                    state.with_notebook(notebook)
-                    self._store.save_notebook(notebook.to_payload())
-                self.events.cell_removed.emit(notebook_id, cell_id)
-                self.events.state_updated.emit(state)
+        now = datetime.now(timezone.utc)
+        for notebook_id in tuple(self._cell_to_notebooks.get(cell_id, ())):
+            self._unindex_cell(notebook_id, cell_id)
+            state = self._states.get(notebook_id)
+            if state is None or not _holds_cell(state, cell_id):
+                continue
+
+            state.remove_cell(cell_id)
+            if cell_id in state.notebook.cell_ids:
+                cell_ids = [cid for cid in state.notebook.cell_ids if cid != cell_id]
+                notebook = state.notebook.copy_with(
+                    cell_ids=cell_ids,
+                    modified_at=now,
+                )
+                state.with_notebook(notebook)
+                self._persist_op(notebook, {"op": "remove", "cell_id": cell_id})
+            self.events.cell_removed.emit(notebook_id, cell_id)
+            self.events.state_updated.emit(state)
+
+
+def _holds_cell(state: NotebookState, cell_id: str) -> bool:
+    """Return True if ``cell_id`` is listed by or loaded into ``state``."""
+
+    return cell_id in state.cells or cell_id in state.notebook.cell_ids
+
+
+def _notebook_digest(notebook: Notebook) -> bytes:
+    """Hash the persisted content of ``notebook``, ignoring ``modified_at``."""
 
+    payload = notebook.to_payload()
+    payload.pop("modified_at", None)
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).digest()
 
 
 __all__ = ["NotebookManager"]
@@ -1,7 +1,7 @@
 """Domain models (cells, notebooks, metadata)."""
 
 from .cell import Cell, CellType
-from .notebook import Notebook
+from .notebook import Notebook, NotebookHeader
 from .notebook_state import NotebookState
 
-__all__ = ["Cell", "CellType", "Notebook", "NotebookState"]
+__all__ = ["Cell", "CellType", "Notebook", "NotebookHeader", "NotebookState"]
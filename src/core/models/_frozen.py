@@ -0,0 +1,70 @@
+"""Read-only JSON containers shared between immutable model snapshots."""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def _readonly(self, *args: Any, **kwargs: Any) -> None:
+    raise TypeError(f"{type(self).__name__} is read-only")
+
+
+class FrozenDict(dict):
+    """A ``dict`` that refuses mutation, so copies can share it by reference."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def copy(self) -> dict[str, Any]:
+        """Return a shallow, mutable ``dict`` copy (nested values stay frozen)."""
+
+        return dict(self)
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "FrozenDict":
+        return self
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+class FrozenList(list):
+    """A ``list`` that refuses mutation, so copies can share it by reference."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = clear = sort = reverse = _readonly
+
+    def copy(self) -> list[Any]:
+        """Return a shallow, mutable ``list`` copy (nested values stay frozen)."""
+
+        return list(self)
+
+    def __copy__(self) -> "FrozenList":
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> "FrozenList":
+        return self
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert JSON-like ``dict``/``list`` values to frozen containers."""
+
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+__all__ = ["FrozenDict", "FrozenList", "freeze"]
@@ -2,8 +2,18 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime, timezone
 
+try:  # pragma: no cover - optional C accelerator
+    from ciso8601 import parse_datetime as _parse_iso
+except ModuleNotFoundError:  # pragma: no cover - stdlib fallback is used
+    _parse_iso = None
+
+_UTC = timezone.utc
+# ``datetime.fromisoformat`` only understands the ``Z`` suffix from 3.11 on.
+_NEEDS_Z_REWRITE = sys.version_info < (3, 11)
+
 
 def parse_timestamp(value: str | None) -> datetime:
     """Parse an ISO 8601 timestamp, accepting trailing ``Z`` notation."""
@@ -11,11 +21,14 @@ def parse_timestamp(value: str | None) -> datetime:
     if not value:
         raise ValueError("Timestamp value is required")
 
-    if value.endswith("Z"):
-        value = f"{value[:-1]}+00:00"
-    parsed = datetime.fromisoformat(value)
+    if _parse_iso is not None:
+        parsed = _parse_iso(value)
+    else:
+        if _NEEDS_Z_REWRITE and value.endswith("Z"):
+            value = f"{value[:-1]}+00:00"
+        parsed = datetime.fromisoformat(value)
     if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=timezone.utc)
+        parsed = parsed.replace(tzinfo=_UTC)
     return parsed
 
 
@@ -23,10 +36,12 @@ def ensure_utc(dt: datetime | None) -> datetime:
     """Return a timezone-aware datetime, defaulting to ``UTC`` when missing."""
 
     if dt is None:
-        dt = datetime.now(timezone.utc)
+        return datetime.now(_UTC)
+    if dt.tzinfo is _UTC:
+        return dt
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    return dt.astimezone(timezone.utc)
+        return dt.replace(tzinfo=_UTC)
+    return dt.astimezone(_UTC)
 
 
 def format_timestamp(dt: datetime | None) -> str:
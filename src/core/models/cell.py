@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Literal
 
+from ._frozen import FrozenDict, FrozenList, freeze
 from ._timestamps import format_timestamp, parse_timestamp
 
 CellType = Literal["code", "markdown", "raw"]
@@ -16,13 +16,17 @@ _UNSET = object()
 
 @dataclass(slots=True, frozen=True)
 class Cell:
-    """Immutable view of a persisted notebook cell with helper utilities."""
+    """Immutable view of a persisted notebook cell with helper utilities.
+
+    ``metadata`` and ``outputs`` are frozen on the way in, so snapshots share
+    them by reference instead of deep-copying potentially large output blobs.
+    """
 
     cell_id: str
     cell_type: CellType
     content: str
-    metadata: dict[str, Any] = field(default_factory=dict)
-    outputs: list[dict[str, Any]] = field(default_factory=list)
+    metadata: dict[str, Any] = field(default_factory=FrozenDict)
+    outputs: list[dict[str, Any]] = field(default_factory=FrozenList)
     execution_count: int | None = None
     created_at: datetime = field(default_factory=datetime.utcnow)
     modified_at: datetime = field(default_factory=datetime.utcnow)
@@ -36,8 +40,8 @@ class Cell:
             cell_id=payload["cell_id"],
             cell_type=payload.get("cell_type", "code"),
             content=payload.get("content", ""),
-            metadata=deepcopy(payload.get("metadata", {})),
-            outputs=deepcopy(payload.get("outputs", [])),
+            metadata=freeze(payload.get("metadata", {})),
+            outputs=freeze(payload.get("outputs", [])),
             execution_count=payload.get("execution_count"),
             created_at=parse_timestamp(payload.get("created_at")),
             modified_at=parse_timestamp(payload.get("modified_at")),
@@ -64,8 +68,8 @@ class Cell:
             cell_id=cell_id,
             cell_type=cell_type,
             content=content,
-            metadata=deepcopy(metadata),
-            outputs=deepcopy(outputs) if outputs else [],
+            metadata=freeze(metadata),
+            outputs=freeze(outputs or []),
             execution_count=execution_count,
             created_at=created_at,
             modified_at=modified_at,
@@ -74,12 +78,18 @@ class Cell:
         )
 
     def to_payload(self) -> dict[str, Any]:
+        """Return a JSON-ready dict for persistence.
+
+        ``metadata`` and ``outputs`` are the cell's shared frozen containers,
+        not copies; treat them as read-only (``copy()`` yields a mutable one).
+        """
+
         return {
             "cell_id": self.cell_id,
             "cell_type": self.cell_type,
             "content": self.content,
-            "metadata": deepcopy(self.metadata),
-            "outputs": deepcopy(self.outputs),
+            "metadata": self.metadata,
+            "outputs": self.outputs,
             "execution_count": self.execution_count,
             "created_at": format_timestamp(self.created_at),
             "modified_at": format_timestamp(self.modified_at),
@@ -102,8 +112,8 @@ class Cell:
             cell_id=self.cell_id,
             cell_type=cell_type or self.cell_type,
             content=content if content is not None else self.content,
-            metadata=deepcopy(metadata) if metadata is not None else deepcopy(self.metadata),
-            outputs=deepcopy(outputs) if outputs is not None else deepcopy(self.outputs),
+            metadata=freeze(metadata) if metadata is not None else self.metadata,
+            outputs=freeze(outputs) if outputs is not None else self.outputs,
             execution_count=self.execution_count if execution_count is _UNSET else execution_count,
             created_at=self.created_at,
             modified_at=modified_at or self.modified_at,
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, List
+from typing import Any, List, Tuple
 
+from ._frozen import FrozenDict, freeze
 from ._timestamps import format_timestamp, parse_timestamp
 
 
@@ -17,10 +17,20 @@ class Notebook:
     notebook_id: str
     title: str
     cell_ids: List[str] = field(default_factory=list)
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=FrozenDict)
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     modified_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     schema_version: int = 1
+    _cell_order: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_cell_order", tuple(self.cell_ids))
+
+    @property
+    def cell_order(self) -> Tuple[str, ...]:
+        """Cell identifiers in display order, as an immutable shared tuple."""
+
+        return self._cell_order
 
     @classmethod
     def from_payload(cls, payload: dict[str, Any]) -> "Notebook":
@@ -28,7 +38,7 @@ class Notebook:
             notebook_id=payload["notebook_id"],
             title=payload.get("title", "Untitled"),
             cell_ids=list(payload.get("cell_ids", [])),
-            metadata=deepcopy(payload.get("metadata", {})),
+            metadata=freeze(payload.get("metadata", {})),
             created_at=parse_timestamp(payload.get("created_at")),
             modified_at=parse_timestamp(payload.get("modified_at")),
             schema_version=int(payload.get("schema_version", 1)),
@@ -50,18 +60,24 @@ class Notebook:
             notebook_id=notebook_id,
             title=title,
             cell_ids=list(cell_ids or []),
-            metadata=deepcopy(metadata) if metadata is not None else {},
+            metadata=freeze(metadata) if metadata is not None else FrozenDict(),
             created_at=created_at,
             modified_at=modified_at,
             schema_version=schema_version,
         )
 
     def to_payload(self) -> dict[str, Any]:
+        """Return a JSON-ready dict for persistence.
+
+        ``metadata`` is the notebook's shared frozen dict, not a copy; treat it
+        as read-only (``copy()`` yields a mutable one).
+        """
+
         return {
             "notebook_id": self.notebook_id,
             "title": self.title,
             "cell_ids": list(self.cell_ids),
-            "metadata": deepcopy(self.metadata),
+            "metadata": self.metadata,
             "created_at": format_timestamp(self.created_at),
             "modified_at": format_timestamp(self.modified_at),
             "schema_version": self.schema_version,
@@ -79,11 +95,30 @@ class Notebook:
             notebook_id=self.notebook_id,
             title=title if title is not None else self.title,
             cell_ids=list(cell_ids if cell_ids is not None else self.cell_ids),
-            metadata=deepcopy(metadata) if metadata is not None else deepcopy(self.metadata),
+            metadata=freeze(metadata) if metadata is not None else self.metadata,
             created_at=self.created_at,
-            modified_at=modified_at or datetime.now(timezone.utc),
+            modified_at=modified_at if modified_at is not None else self.modified_at,
             schema_version=self.schema_version,
         )
 
 
-__all__ = ["Notebook"]
+@dataclass(slots=True, frozen=True)
+class NotebookHeader:
+    """Listing entry for a notebook, cheap enough to build for every notebook."""
+
+    notebook_id: str
+    title: str
+    created_at: datetime
+    modified_at: datetime
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "NotebookHeader":
+        return cls(
+            notebook_id=payload["notebook_id"],
+            title=payload.get("title") or "Untitled",
+            created_at=parse_timestamp(payload.get("created_at")),
+            modified_at=parse_timestamp(payload.get("modified_at")),
+        )
+
+
+__all__ = ["Notebook", "NotebookHeader"]
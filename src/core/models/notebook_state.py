@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, Iterator
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, Sequence, Set, Tuple
 
 from .cell import Cell
 from .notebook import Notebook
@@ -11,40 +11,91 @@ from .notebook import Notebook
 
 @dataclass(slots=True)
 class NotebookState:
-    """Holds a notebook record and the cells currently loaded in memory."""
+    """Holds a notebook record and the cells currently loaded in memory.
+
+    When ``cell_loader`` is set, cells listed in the notebook but absent from
+    ``cells`` are fetched on first access rather than all up front. Ids the
+    loader cannot resolve are remembered in :meth:`missing_cell_ids`.
+    """
 
     notebook: Notebook
     cells: Dict[str, Cell] = field(default_factory=dict)
     active_cell_id: str | None = None
+    cell_loader: Callable[[str], Cell | None] | None = field(
+        default=None, repr=False, compare=False
+    )
+    _ordered_cells: Tuple[Cell, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _missing_cell_ids: Set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
 
-    def cell_order(self) -> list[str]:
-        return list(self.notebook.cell_ids)
+    def cell_order(self) -> Sequence[str]:
+        return self.notebook.cell_order
 
     def get_cell(self, cell_id: str) -> Cell | None:
-        return self.cells.get(cell_id)
+        cell = self.cells.get(cell_id)
+        if cell is None and cell_id in self.notebook.cell_ids:
+            cell = self._load_cell(cell_id)
+        return cell
+
+    def missing_cell_ids(self) -> FrozenSet[str]:
+        """Ids listed by the notebook that the loader could not resolve."""
+
+        return frozenset(self._missing_cell_ids)
+
+    def ordered_cells(self) -> Tuple[Cell, ...]:
+        """Loaded cells in notebook order, cached until the state changes."""
+
+        if self._ordered_cells is None:
+            cells = self.cells
+            ordered = []
+            for cell_id in self.notebook.cell_ids:
+                cell = cells.get(cell_id)
+                if cell is None:
+                    cell = self._load_cell(cell_id)
+                if cell is not None:
+                    ordered.append(cell)
+            self._ordered_cells = tuple(ordered)
+        return self._ordered_cells
 
     def iter_cells(self) -> Iterator[Cell]:
-        for cell_id in self.notebook.cell_ids:
-            cell = self.cells.get(cell_id)
-            if cell:
-                yield cell
+        return iter(self.ordered_cells())
 
     def with_notebook(self, notebook: Notebook) -> "NotebookState":
         self.notebook = notebook
+        self._ordered_cells = None
+        if self._missing_cell_ids:
+            self._missing_cell_ids.intersection_update(notebook.cell_ids)
         return self
 
     def set_cell(self, cell: Cell) -> None:
         self.cells[cell.cell_id] = cell
+        self._ordered_cells = None
 
     def remove_cell(self, cell_id: str) -> None:
         if cell_id in self.cells:
             del self.cells[cell_id]
+            self._ordered_cells = None
         if self.active_cell_id == cell_id:
             self.active_cell_id = None
 
     def update_cells(self, cells: Iterable[Cell]) -> None:
         for cell in cells:
-            self.set_cell(cell)
+            self.cells[cell.cell_id] = cell
+        self._ordered_cells = None
+
+    def _load_cell(self, cell_id: str) -> Cell | None:
+        if self.cell_loader is None or cell_id in self._missing_cell_ids:
+            return None
+
+        cell = self.cell_loader(cell_id)
+        if cell is None:
+            self._missing_cell_ids.add(cell_id)
+            return None
+        self.cells[cell_id] = cell
+        return cell
 
 
 __all__ = ["NotebookState"]
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 from pathlib import Path
 from typing import Any
 
@@ -11,36 +16,96 @@ try:  # pragma: no cover - Qt may be unavailable during tests
 except ModuleNotFoundError:  # pragma: no cover - fallback path will be used
     QStandardPaths = None  # type: ignore[assignment]
 
+# Number of replayed operations after which the notebook log is folded back
+# into a fresh checkpoint on load.
+_OPLOG_COMPACT_THRESHOLD = 200
+
 
 class DataStore:
     """Handle notebook and cell persistence using JSON files."""
 
-    def __init__(self, root_dir: Path | str | None = None) -> None:
+    def __init__(self, root_dir: Path | str | None = None, *, fsync: bool = False) -> None:
+        """Create a store rooted at ``root_dir``.
+
+        With ``fsync=True`` every write is flushed to disk before it replaces
+        the previous file, trading save latency for crash durability.
+        """
+
+        self._fsync = fsync
         self._data_dir = self._resolve_root(root_dir)
         self._notebooks_dir = self._data_dir / "notebooks"
         self._cells_dir = self._data_dir / "cells"
+        # notebook_id -> (stat signature of checkpoint + log, parsed payload)
+        self._notebook_cache: dict[str, tuple[tuple, dict[str, Any]]] = {}
+        # Digest of the bytes last written to each path, to skip identical rewrites
+        self._written_hashes: dict[Path, bytes] = {}
+        # notebook_id -> header entry mirrored in notebooks/_index.json
+        self._index_path = self._notebooks_dir / "_index.json"
+        self._index: dict[str, dict[str, Any]] | None = None
+        self._index_lock = threading.Lock()
 
         self._notebooks_dir.mkdir(parents=True, exist_ok=True)
         self._cells_dir.mkdir(parents=True, exist_ok=True)
 
     def load_notebook(self, notebook_id: str) -> dict[str, Any] | None:
         file_path = self._notebooks_dir / f"{notebook_id}.json"
-        if not file_path.exists():
+        signature = self._notebook_signature(notebook_id)
+        if signature is None:
             return None
 
+        cached = self._notebook_cache.get(notebook_id)
+        if cached is not None and cached[0] == signature:
+            return deepcopy(cached[1])
+
         try:
-            with file_path.open("r", encoding="utf-8") as handle:
-                return json.load(handle)
-        except (json.JSONDecodeError, OSError):
+            payload = json.loads(file_path.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
             return None
 
+        ops = self._read_notebook_ops(notebook_id)
+        for op in ops:
+            _apply_notebook_op(payload, op)
+        if len(ops) > _OPLOG_COMPACT_THRESHOLD:
+            self.save_notebook(payload)
+        else:
+            self._notebook_cache[notebook_id] = (signature, deepcopy(payload))
+        return payload
+
     def save_notebook(self, notebook_data: dict[str, Any]) -> bool:
+        """Write a full notebook checkpoint and discard its operation log."""
+
         notebook_id = notebook_data.get("notebook_id")
         if not notebook_id:
             return False
 
         file_path = self._notebooks_dir / f"{notebook_id}.json"
-        return self._atomic_write(file_path, notebook_data)
+        self._notebook_cache.pop(notebook_id, None)
+        if not self._atomic_write(file_path, notebook_data):
+            return False
+
+        self._remove_file(self._oplog_path(notebook_id))
+        self._update_index(notebook_id, _notebook_header(notebook_data))
+        return True
+
+    def append_notebook_op(self, notebook_id: str, op: dict[str, Any]) -> bool:
+        """Append a cell ordering operation to the notebook's log.
+
+        Operations are replayed on top of the last checkpoint written by
+        :meth:`save_notebook`, so an edit costs one appended line instead of
+        a rewrite of the whole notebook document.
+        """
+
+        if not notebook_id:
+            return False
+
+        self._notebook_cache.pop(notebook_id, None)
+        try:
+            line = json.dumps(op, ensure_ascii=False)
+            with self._oplog_path(notebook_id).open("a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+            return True
+        except (OSError, TypeError):
+            return False
 
     def load_cell(self, cell_id: str) -> dict[str, Any] | None:
         file_path = self._cells_dir / f"{cell_id}.json"
@@ -48,9 +113,8 @@ class DataStore:
             return None
 
         try:
-            with file_path.open("r", encoding="utf-8") as handle:
-                return json.load(handle)
-        except (json.JSONDecodeError, OSError):
+            return json.loads(file_path.read_bytes())
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
             return None
 
     def save_cell(self, cell_data: dict[str, Any]) -> bool:
@@ -63,6 +127,10 @@ class DataStore:
 
     def delete_notebook(self, notebook_id: str) -> bool:
         file_path = self._notebooks_dir / f"{notebook_id}.json"
+        self._notebook_cache.pop(notebook_id, None)
+        self._written_hashes.pop(file_path, None)
+        self._remove_file(self._oplog_path(notebook_id))
+        self._update_index(notebook_id, None)
         try:
             if file_path.exists():
                 file_path.unlink()
@@ -73,6 +141,7 @@ class DataStore:
 
     def delete_cell(self, cell_id: str) -> bool:
         file_path = self._cells_dir / f"{cell_id}.json"
+        self._written_hashes.pop(file_path, None)
         try:
             if file_path.exists():
                 file_path.unlink()
@@ -82,12 +151,36 @@ class DataStore:
             return False
 
     def list_notebooks(self) -> list[dict[str, Any]]:
-        notebooks: list[dict[str, Any]] = []
-        for file_path in self._notebooks_dir.glob("*.json"):
-            data = self.load_notebook(file_path.stem)
-            if data:
-                notebooks.append(data)
-        return notebooks
+        notebook_ids = self._list_notebook_ids()
+        if len(notebook_ids) <= 1:
+            loaded = [self.load_notebook(notebook_id) for notebook_id in notebook_ids]
+        else:
+            # Loading is I/O bound, so overlap the reads across a small pool.
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(notebook_ids))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                loaded = list(executor.map(self.load_notebook, notebook_ids))
+        return [data for data in loaded if data]
+
+    def list_notebook_headers(self) -> list[dict[str, Any]]:
+        """Return id, title and timestamps for every notebook without loading them.
+
+        Headers come from ``notebooks/_index.json``, which :meth:`save_notebook`
+        and :meth:`delete_notebook` keep current. ``modified_at`` reflects the
+        last checkpoint rather than logged cell operations. A missing or
+        unreadable index is rebuilt from the notebook files.
+        """
+
+        with self._index_lock:
+            index = self._read_index()
+        if index is None:
+            index = {}
+            for payload in self.list_notebooks():
+                header = _notebook_header(payload)
+                index[header["notebook_id"]] = header
+            with self._index_lock:
+                self._index = index
+                self._atomic_write(self._index_path, {"notebooks": list(index.values())})
+        return [dict(header) for header in index.values()]
 
     @property
     def data_root(self) -> Path:
@@ -109,15 +202,116 @@ class DataStore:
         # Fallback to a hidden directory inside the user's home folder
             return Path.home() / ".lunaqt"
 
+    def _oplog_path(self, notebook_id: str) -> Path:
+        return self._notebooks_dir / f"{notebook_id}.oplog"
+
+    def _read_index(self) -> dict[str, dict[str, Any]] | None:
+        if self._index is not None:
+            return self._index
+
+        try:
+            entries = json.loads(self._index_path.read_bytes())["notebooks"]
+            index = {entry["notebook_id"]: entry for entry in entries}
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
+            return None
+        self._index = index
+        return index
+
+    def _update_index(self, notebook_id: str, header: dict[str, Any] | None) -> None:
+        with self._index_lock:
+            index = self._read_index()
+            if index is None:
+                # Nothing to keep in sync; the next listing rebuilds the index.
+                return
+
+            if header is None:
+                if index.pop(notebook_id, None) is None:
+                    return
+            elif index.get(notebook_id) == header:
+                return
+            else:
+                index[notebook_id] = header
+            self._atomic_write(self._index_path, {"notebooks": list(index.values())})
+
+    def _list_notebook_ids(self) -> list[str]:
+        try:
+            with os.scandir(self._notebooks_dir) as entries:
+                return [
+                    entry.name[:-5]
+                    for entry in entries
+                    if entry.name.endswith(".json")
+                    and not entry.name.startswith("_")
+                    and entry.is_file(follow_symlinks=False)
+                ]
+        except OSError:
+            return []
+
+    def _notebook_signature(self, notebook_id: str) -> tuple | None:
+        """Return the stat signature of a notebook's checkpoint and log files."""
+
+        try:
+            stat = (self._notebooks_dir / f"{notebook_id}.json").stat()
+        except OSError:
+            return None
+
+        try:
+            log_stat = self._oplog_path(notebook_id).stat()
+            log_signature = (log_stat.st_mtime_ns, log_stat.st_size)
+        except OSError:
+            log_signature = None
+        return (stat.st_mtime_ns, stat.st_size, log_signature)
+
+    def _read_notebook_ops(self, notebook_id: str) -> list[dict[str, Any]]:
+        log_path = self._oplog_path(notebook_id)
+        if not log_path.exists():
+            return []
+
+        try:
+            raw = log_path.read_bytes()
+        except OSError:
+            return []
+
+        ops: list[dict[str, Any]] = []
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            try:
+                ops.append(json.loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # A torn trailing write; everything before it is valid.
+                break
+        return ops
+
+    @staticmethod
+    def _remove_file(file_path: Path) -> None:
+        try:
+            if file_path.exists():
+                file_path.unlink()
+        except OSError:
+            pass
+
     def _atomic_write(self, file_path: Path, data: dict[str, Any]) -> bool:
-        temp_path = file_path.with_suffix(".tmp")
         try:
-            with temp_path.open("w", encoding="utf-8") as handle:
-                json.dump(data, handle, indent=2, ensure_ascii=False)
+            encoded = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError):
+            return False
+
+        digest = hashlib.blake2b(encoded, digest_size=16).digest()
+        if self._written_hashes.get(file_path) == digest and file_path.exists():
+            return True
 
+        temp_path = file_path.with_suffix(".tmp")
+        try:
+            with temp_path.open("wb") as handle:
+                handle.write(encoded)
+                if self._fsync:
+                    handle.flush()
+                    os.fsync(handle.fileno())
             temp_path.replace(file_path)
+            self._written_hashes[file_path] = digest
             return True
-        except (OSError, TypeError):
+        except OSError:
+            self._written_hashes.pop(file_path, None)
             if temp_path.exists():
                 try:
                     temp_path.unlink()
@@ -126,4 +320,39 @@ class DataStore:
             return False
 
 
+def _notebook_header(payload: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "notebook_id": payload.get("notebook_id"),
+        "title": payload.get("title"),
+        "created_at": payload.get("created_at"),
+        "modified_at": payload.get("modified_at"),
+    }
+
+
+def _apply_notebook_op(payload: dict[str, Any], op: dict[str, Any]) -> None:
+    """Replay a single logged operation onto a notebook payload in place."""
+
+    cell_ids = payload.setdefault("cell_ids", [])
+    kind = op.get("op")
+    cell_id = op.get("cell_id")
+
+    if kind == "insert":
+        position = max(0, min(int(op.get("position", len(cell_ids))), len(cell_ids)))
+        cell_ids.insert(position, cell_id)
+    elif kind == "remove":
+        if cell_id in cell_ids:
+            cell_ids.remove(cell_id)
+    elif kind == "move":
+        if cell_id not in cell_ids:
+            return
+        cell_ids.remove(cell_id)
+        position = max(0, min(int(op.get("position", len(cell_ids))), len(cell_ids)))
+        cell_ids.insert(position, cell_id)
+    else:
+        return
+
+    if op.get("modified_at"):
+        payload["modified_at"] = op["modified_at"]
+
+
 __all__ = ["DataStore"]
@@ -1,4 +1,9 @@
-"""Dockable sidebar widgets (settings, notebooks, etc.)."""
+"""Dockable sidebar widgets (settings, notebooks, etc.).
+
+Signals are connected through their bound attributes (``signal.connect(slot)``
+or constructor keywords such as ``activated=``); string based
+``SIGNAL()``/``SLOT()`` connections are not used in this package.
+"""
 
 from .notebook_sidebar import NotebookSidebarWidget
 from .settings_sidebar import SettingsSidebarWidget
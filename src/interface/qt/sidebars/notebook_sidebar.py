@@ -2,27 +2,148 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
+from typing import Any, ContextManager
+
 try:  # pragma: no cover - only imported when Qt is available
-    from PySide6.QtCore import Qt, Signal
+    from PySide6.QtCore import QAbstractListModel, QModelIndex, QSignalBlocker, Qt, QTimer, Signal
     from PySide6.QtGui import QKeySequence, QShortcut
     from PySide6.QtWidgets import (
         QAbstractItemView,
-        QHBoxLayout,
-        QListWidget,
-        QListWidgetItem,
+        QListView,
         QPushButton,
         QSizePolicy,
-        QVBoxLayout,
         QWidget,
     )
 except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
     raise SystemExit("PySide6 must be installed to use the sidebar widgets.") from exc
 
+from interface.qt.styling.layout_utils import hbox, vbox
 from interface.qt.styling.theme.widget_tokens import ButtonTokens, SidebarTokens
 
+# Built once per process and shared by every sidebar instance.
+_DELETE_SEQ = QKeySequence(Qt.Key.Key_Delete)
+
+# Roles arrive from Qt as plain ints; compare against cached ints instead of
+# resolving and converting the enum members on every data() call.
+_EDIT_ROLE = int(Qt.ItemDataRole.EditRole)
+_TITLE_ROLES = frozenset((int(Qt.ItemDataRole.DisplayRole), _EDIT_ROLE))
+
+
+class NotebookListModel(QAbstractListModel):
+    """Flat list of ``(notebook_id, title)`` rows shown by the notebook sidebar.
+
+    Ids are only exposed through :meth:`notebook_id`/:meth:`row_for`; views
+    see titles alone, so no id ever round-trips through a ``QVariant``.
+
+    Edits made through the view do not change the stored title; they are
+    reported through :attr:`title_edit_requested` and only applied once the
+    owner confirms them with :meth:`set_title`.
+    """
+
+    title_edit_requested = Signal(str, str)
+
+    # Every row has the same flags; combine them once instead of per query.
+    _ITEM_FLAGS = (
+        Qt.ItemFlag.ItemIsSelectable
+        | Qt.ItemFlag.ItemIsEnabled
+        | Qt.ItemFlag.ItemIsEditable
+    )
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows: list[tuple[str, str]] = []
+        self._id_to_row: dict[str, int] = {}
+
+    # Qt model API -------------------------------------------------------
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role in _TITLE_ROLES:
+            return self._rows[index.row()][1]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return self._ITEM_FLAGS
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid() or role != _EDIT_ROLE:
+            return False
+
+        notebook_id, title = self._rows[index.row()]
+        new_title = str(value).strip()
+        if not new_title or new_title == title:
+            # Nothing to rename; repaint so the editor text is discarded.
+            self.dataChanged.emit(index, index)
+            return False
+
+        self.title_edit_requested.emit(notebook_id, new_title)
+        return True
+
+    # Row helpers ----------------------------------------------------------
+    def reset_rows(self, rows: list[tuple[str, str]]) -> None:
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._id_to_row = {notebook_id: row for row, (notebook_id, _) in enumerate(self._rows)}
+        self.endResetModel()
+
+    def append_row(self, notebook_id: str, title: str) -> int:
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append((notebook_id, title))
+        self._id_to_row[notebook_id] = row
+        self.endInsertRows()
+        return row
+
+    def remove_row(self, row: int) -> None:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        notebook_id, _ = self._rows.pop(row)
+        del self._id_to_row[notebook_id]
+        self._reindex_from(row)
+        self.endRemoveRows()
+
+    def move_row(self, row: int, target: int) -> bool:
+        if row == target:
+            return False
+        # Qt expects the destination as the row *before* which to insert.
+        destination = target + 1 if target > row else target
+        if not self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), destination):
+            return False
+        self._rows.insert(target, self._rows.pop(row))
+        self._reindex_from(min(row, target))
+        self.endMoveRows()
+        return True
+
+    def set_title(self, row: int, title: str) -> None:
+        notebook_id, _ = self._rows[row]
+        self._rows[row] = (notebook_id, title)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def refresh_row(self, row: int) -> None:
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def row_for(self, notebook_id: str) -> int | None:
+        return self._id_to_row.get(notebook_id)
+
+    def notebook_id(self, row: int) -> str | None:
+        if 0 <= row < len(self._rows):
+            return self._rows[row][0]
+        return None
+
+    def _reindex_from(self, start_row: int) -> None:
+        for row in range(start_row, len(self._rows)):
+            self._id_to_row[self._rows[row][0]] = row
+
 
 class NotebookSidebarWidget(QWidget):
-    """Sidebar panel placeholder that will later list notebooks."""
+    """Sidebar panel listing notebooks, backed by a :class:`NotebookListModel`."""
 
     add_notebook_clicked = Signal()
     move_notebook_up_clicked = Signal()
@@ -43,20 +164,46 @@ class NotebookSidebarWidget(QWidget):
         self.setAutoFillBackground(True)
         self._tokens = tokens
         self._button_tokens = button_tokens
-        self._suppress_item_changed = False
+        self._model = NotebookListModel(self)
+        self._model.title_edit_requested.connect(self._queue_rename)
+        # Renames are coalesced per notebook and emitted on the next loop tick.
+        self._pending_renames: dict[str, str] = {}
+        self._rename_flush_scheduled = False
+        # The widget tree is built on first show. Until then the current
+        # notebook lives in _pending_select_id and is applied to the list view
+        # once it exists.
+        self._built = False
+        self._pending_select_id: str | None = None
+        self._last_selected_id: str | None = None
+        self._add_button: QPushButton | None = None
+        self._move_up_button: QPushButton | None = None
+        self._move_down_button: QPushButton | None = None
+        # Last enabled state pushed to the move buttons (None = never set).
+        self._move_up_enabled: bool | None = None
+        self._move_down_enabled: bool | None = None
+
+    def showEvent(self, event) -> None:
+        self._ensure_built()
+        super().showEvent(event)
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        self._built = True
         self._build_ui()
         self._setup_shortcuts()
 
+        pending_id, self._pending_select_id = self._pending_select_id, None
+        row = self._row_for(pending_id) if pending_id else None
+        if row is not None:
+            # Already reported by select_notebook(), so _on_current_changed
+            # will not emit it again.
+            self._list.setCurrentIndex(self._model.index(row))
+        self._update_move_buttons()
+
     def _build_ui(self) -> None:
         """Build the 3-row sidebar layout: Header (via dock title) | Toolbar | Content."""
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(
-            self._tokens.layout_root_margin_left,
-            self._tokens.layout_root_margin_top,
-            self._tokens.layout_root_margin_right,
-            self._tokens.layout_root_margin_bottom,
-        )
-        layout.setSpacing(0)
+        layout = vbox(self, self._tokens.root_margins)
 
         # Row 2: Toolbar with action buttons
         toolbar = self._build_toolbar()
@@ -74,32 +221,42 @@ class NotebookSidebarWidget(QWidget):
         toolbar.setMinimumHeight(self._tokens.sidebar_toolbar_min_height)
         toolbar.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
         
-        toolbar_layout = QHBoxLayout(toolbar)
-        toolbar_layout.setContentsMargins(
-            self._tokens.layout_toolbar_margin_left,
-            self._tokens.layout_toolbar_margin_top,
-            self._tokens.layout_toolbar_margin_right,
-            self._tokens.layout_toolbar_margin_bottom,
+        self._toolbar_layout = hbox(
+            toolbar,
+            self._tokens.toolbar_margins,
+            self._tokens.sidebar_toolbar_item_x_spacing,
         )
-        toolbar_layout.setSpacing(self._tokens.sidebar_toolbar_item_x_spacing)
-        
+        self._toolbar_layout.addStretch()
+
+        # The buttons are added on the next event-loop tick so the dock can
+        # paint its frame first; the toolbar's fixed height keeps the layout
+        # from jumping when they appear.
+        QTimer.singleShot(0, self, self._populate_toolbar_buttons)
+
+        return toolbar
+
+    def _populate_toolbar_buttons(self) -> None:
+        """Create the Add/Move Up/Move Down buttons ahead of the stretch."""
+        if self._add_button is not None:
+            return
+        toolbar = self._toolbar_layout.parentWidget()
+
         self._add_button = QPushButton("Add Notebook", toolbar)
         self._add_button.clicked.connect(self.add_notebook_clicked)
         self._configure_toolbar_button(self._add_button)
-        toolbar_layout.addWidget(self._add_button)
+        self._toolbar_layout.insertWidget(0, self._add_button)
 
         self._move_up_button = QPushButton("Move Up", toolbar)
         self._move_up_button.clicked.connect(self.move_notebook_up_clicked)
         self._configure_toolbar_button(self._move_up_button)
-        toolbar_layout.addWidget(self._move_up_button)
+        self._toolbar_layout.insertWidget(1, self._move_up_button)
 
         self._move_down_button = QPushButton("Move Down", toolbar)
         self._move_down_button.clicked.connect(self.move_notebook_down_clicked)
         self._configure_toolbar_button(self._move_down_button)
-        toolbar_layout.addWidget(self._move_down_button)
-        toolbar_layout.addStretch()
-        
-        return toolbar
+        self._toolbar_layout.insertWidget(2, self._move_down_button)
+
+        self._update_move_buttons()
 
     def _configure_toolbar_button(self, button: QPushButton) -> None:
         """Apply shared sidebar toolbar styling hints to a button."""
@@ -112,178 +269,171 @@ class NotebookSidebarWidget(QWidget):
         content.setProperty("sidebarRole", "content")
         content.setAutoFillBackground(True)
         
-        content_layout = QVBoxLayout(content)
-        content_layout.setContentsMargins(
-            self._tokens.layout_content_margin_left,
-            self._tokens.layout_content_margin_top,
-            self._tokens.layout_content_margin_right,
-            self._tokens.layout_content_margin_bottom,
-        )
-        content_layout.setSpacing(8)
+        content_layout = vbox(content, self._tokens.content_margins, 8)
         
-        self._list = QListWidget(content)
-        self._list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
+        self._list = QListView(content)
+        self._list.setModel(self._model)
+        self._list.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self._list.setEditTriggers(
             QAbstractItemView.EditTrigger.DoubleClicked
             | QAbstractItemView.EditTrigger.EditKeyPressed
             | QAbstractItemView.EditTrigger.SelectedClicked
         )
-        self._list.itemSelectionChanged.connect(self._on_selection_changed)
-        self._list.itemChanged.connect(self._on_item_changed)
+        self._list.selectionModel().currentChanged.connect(self._on_current_changed)
 
         content_layout.addWidget(self._list)
 
         return content
 
     def _setup_shortcuts(self) -> None:
-        delete_shortcut = QShortcut(QKeySequence(Qt.Key_Delete), self._list)
-        delete_shortcut.activated.connect(self._emit_delete_for_current)
-        self._delete_shortcut = delete_shortcut
+        self._delete_shortcut = QShortcut(
+            _DELETE_SEQ,
+            self._list,
+            activated=self._emit_delete_for_current,
+        )
 
     # ------------------------------------------------------------------
     # Public API used by the main window
     # ------------------------------------------------------------------
     def set_notebooks(self, notebooks: list[tuple[str, str]]) -> None:
-        self._with_suppressed_item_changed(self._list.clear)
-        for notebook_id, title in notebooks:
-            self._append_item(notebook_id, title)
+        if not self._built:
+            # A full reset drops the current notebook, as it does in the view.
+            self._pending_select_id = None
+        with self._selection_blocked():
+            self._model.reset_rows(notebooks)
         self._update_move_buttons()
 
     def add_notebook(self, notebook_id: str, title: str, *, select: bool = False) -> None:
-        item = self._append_item(notebook_id, title)
+        self._model.append_row(notebook_id, title)
         if select:
             self.select_notebook(notebook_id)
         self._update_move_buttons()
-        return item
 
     def update_notebook_title(self, notebook_id: str, title: str) -> None:
-        item = self._find_item(notebook_id)
-        if not item:
+        row = self._row_for(notebook_id)
+        if row is None:
             return
-        self._set_item_title(item, title)
+        self._model.set_title(row, title)
 
     def remove_notebook(self, notebook_id: str) -> str | None:
         row = self._row_for(notebook_id)
         if row is None:
             return self.current_notebook_id()
 
-        self._with_suppressed_item_changed(lambda: self._list.takeItem(row))
-        next_row = min(row, self._list.count() - 1)
-        next_id: str | None = None
-        if 0 <= next_row < self._list.count():
-            next_item = self._list.item(next_row)
-            next_id = next_item.data(self._NOTEBOOK_ID_ROLE)
+        if notebook_id == self._last_selected_id:
+            self._last_selected_id = None
+        if not self._built and notebook_id == self._pending_select_id:
+            self._pending_select_id = None
+        was_current = self._built and row == self._current_row()
+        with self._selection_blocked():
+            self._model.remove_row(row)
+            if was_current:
+                # Leave no current row so the caller's select_notebook() of
+                # the successor is reported as a real selection change.
+                self._list.selectionModel().clearCurrentIndex()
+        next_id = self._model.notebook_id(min(row, self._model.rowCount() - 1))
         self._update_move_buttons()
         return next_id
 
     def restore_notebook_title(self, notebook_id: str) -> None:
-        item = self._find_item(notebook_id)
-        if not item:
-            return
-        previous_title = item.data(self._NOTEBOOK_TITLE_ROLE)
-        if previous_title:
-            self._set_item_title(item, previous_title)
+        # Rejected edits never reach the stored title; just repaint the row.
+        row = self._row_for(notebook_id)
+        if row is not None:
+            self._model.refresh_row(row)
+
+    def move_current_notebook(self, step: int) -> bool:
+        """Move the selected notebook ``step`` rows, keeping it selected."""
+        self._ensure_built()
+        row = self._current_row()
+        target = row + step
+        if row < 0 or not 0 <= target < self._model.rowCount():
+            return False
+
+        # Persistent indexes follow the moved row, so the selection stays put.
+        moved = self._model.move_row(row, target)
+        self._update_move_buttons()
+        return moved
 
     def select_notebook(self, notebook_id: str) -> None:
         row = self._row_for(notebook_id)
         if row is None:
             return
-        self._list.setCurrentRow(row)
+        if self._built:
+            self._list.setCurrentIndex(self._model.index(row))
+            return
+        # Hidden sidebar: track the selection and report it now; only the
+        # list view update waits for the build.
+        self._pending_select_id = notebook_id
+        if notebook_id != self._last_selected_id:
+            self._last_selected_id = notebook_id
+            self.notebook_selected.emit(notebook_id)
 
     def current_notebook_id(self) -> str | None:
-        item = self._list.currentItem()
-        if not item:
-            return None
-        return item.data(self._NOTEBOOK_ID_ROLE)
+        if not self._built:
+            return self._pending_select_id
+        return self._model.notebook_id(self._current_row())
 
     def first_notebook_id(self) -> str | None:
-        if self._list.count() == 0:
-            return None
-        return self._list.item(0).data(self._NOTEBOOK_ID_ROLE)
+        return self._model.notebook_id(0)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    _NOTEBOOK_ID_ROLE = Qt.ItemDataRole.UserRole
-    _NOTEBOOK_TITLE_ROLE = Qt.ItemDataRole.UserRole + 1
-
-    def _append_item(self, notebook_id: str, title: str) -> QListWidgetItem:
-        item = QListWidgetItem()
-        item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled)
-        item.setData(self._NOTEBOOK_ID_ROLE, notebook_id)
-        self._set_item_title(item, title)
-        self._with_suppressed_item_changed(lambda: self._list.addItem(item))
-        return item
+    def _row_for(self, notebook_id: str) -> int | None:
+        return self._model.row_for(notebook_id)
 
-    def _set_item_title(self, item: QListWidgetItem, title: str) -> None:
-        def _apply() -> None:
-            item.setText(title)
-            item.setData(self._NOTEBOOK_TITLE_ROLE, title)
+    def _selection_blocked(self) -> ContextManager[object]:
+        """Silence selection-model signals for programmatic bulk changes."""
+        if not self._built:
+            return nullcontext()
+        return QSignalBlocker(self._list.selectionModel())
 
-        self._with_suppressed_item_changed(_apply)
+    def _current_row(self) -> int:
+        return self._list.currentIndex().row()
 
-    def _row_for(self, notebook_id: str) -> int | None:
-        for row in range(self._list.count()):
-            item = self._list.item(row)
-            if item.data(self._NOTEBOOK_ID_ROLE) == notebook_id:
-                return row
-        return None
+    def _queue_rename(self, notebook_id: str, title: str) -> None:
+        self._pending_renames[notebook_id] = title
+        if not self._rename_flush_scheduled:
+            self._rename_flush_scheduled = True
+            QTimer.singleShot(0, self, self._flush_renames)
 
-    def _find_item(self, notebook_id: str) -> QListWidgetItem | None:
-        row = self._row_for(notebook_id)
-        return self._list.item(row) if row is not None else None
-
-    def _with_suppressed_item_changed(self, callback) -> None:
-        previous = self._suppress_item_changed
-        self._suppress_item_changed = True
-        try:
-            callback()
-        finally:
-            self._suppress_item_changed = previous
+    def _flush_renames(self) -> None:
+        pending, self._pending_renames = self._pending_renames, {}
+        self._rename_flush_scheduled = False
+        for notebook_id, title in pending.items():
+            self.rename_notebook_requested.emit(notebook_id, title)
 
     def _emit_delete_for_current(self) -> None:
         notebook_id = self.current_notebook_id()
         if notebook_id:
             self.delete_notebook_requested.emit(notebook_id)
 
-    def _on_selection_changed(self) -> None:
+    def _on_current_changed(self, current: QModelIndex, previous: QModelIndex) -> None:
         """Handle notebook selection changes."""
-        selected = self._list.currentItem()
-        if selected:
-            notebook_id = selected.data(self._NOTEBOOK_ID_ROLE)
-            if notebook_id:
-                self.notebook_selected.emit(notebook_id)
+        notebook_id = self._model.notebook_id(current.row())
+        # Resets and re-selections can land on the notebook that is already
+        # selected; only report genuine changes downstream.
+        if notebook_id and notebook_id != self._last_selected_id:
+            self._last_selected_id = notebook_id
+            self.notebook_selected.emit(notebook_id)
         self._update_move_buttons()
 
-    def _on_item_changed(self, item: QListWidgetItem) -> None:
-        if self._suppress_item_changed:
-            return
-
-        notebook_id = item.data(self._NOTEBOOK_ID_ROLE)
-        if not notebook_id:
-            return
-
-        new_title = item.text().strip()
-        if not new_title:
-            self.restore_notebook_title(notebook_id)
-            return
-
-        previous_title = item.data(self._NOTEBOOK_TITLE_ROLE)
-        if previous_title == new_title:
-            return
-
-        self.rename_notebook_requested.emit(notebook_id, new_title)
-
     def _update_move_buttons(self) -> None:
-        if not hasattr(self, "_move_up_button"):
+        if self._move_up_button is None or self._move_down_button is None:
             return
 
-        count = self._list.count()
-        current_row = self._list.currentRow()
+        count = self._model.rowCount()
+        current_row = self._current_row()
         has_selection = current_row >= 0
 
-        self._move_up_button.setEnabled(has_selection and current_row > 0)
-        self._move_down_button.setEnabled(has_selection and current_row < count - 1)
+        up_enabled = has_selection and current_row > 0
+        down_enabled = has_selection and current_row < count - 1
+        if up_enabled != self._move_up_enabled:
+            self._move_up_button.setEnabled(up_enabled)
+            self._move_up_enabled = up_enabled
+        if down_enabled != self._move_down_enabled:
+            self._move_down_button.setEnabled(down_enabled)
+            self._move_down_enabled = down_enabled
 
 
-__all__ = ["NotebookSidebarWidget"]
+__all__ = ["NotebookListModel", "NotebookSidebarWidget"]
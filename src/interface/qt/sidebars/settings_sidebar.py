@@ -9,15 +9,14 @@ try:  # pragma: no cover - only imported when Qt is available
     from PySide6.QtWidgets import (
         QComboBox,
         QFormLayout,
-        QHBoxLayout,
         QLabel,
         QSpinBox,
-        QVBoxLayout,
         QWidget,
     )
 except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
     raise SystemExit("PySide6 must be installed to use the sidebar widgets.") from exc
 
+from interface.qt.styling.layout_utils import vbox
 from interface.qt.styling.theme.widget_tokens import SidebarTokens
 
 class SettingsSidebarWidget(QWidget):
@@ -49,14 +48,7 @@ class SettingsSidebarWidget(QWidget):
         self._configure_font_combo(ui_font_family)
         self._configure_font_spin(ui_font_size, min_font_size, max_font_size, step)
 
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(
-            tokens.layout_root_margin_left,
-            tokens.layout_root_margin_top,
-            tokens.layout_root_margin_right,
-            tokens.layout_root_margin_bottom,
-        )
-        main_layout.setSpacing(0)
+        main_layout = vbox(self, tokens.root_margins)
         
         # Row 2: Toolbar (not used in settings)
         #toolbar = self._build_toolbar()
@@ -111,14 +103,7 @@ class SettingsSidebarWidget(QWidget):
         container = QWidget(self)
         container.setProperty("sidebarRole", "content")
         container.setAutoFillBackground(True)
-        content_layout = QVBoxLayout(container)
-        content_layout.setContentsMargins(
-            self._tokens.layout_content_margin_left,
-            self._tokens.layout_content_margin_top,
-            self._tokens.layout_content_margin_right,
-            self._tokens.layout_content_margin_bottom,
-        )
-        content_layout.setSpacing(12)
+        content_layout = vbox(container, self._tokens.content_margins, 12)
 
         #typography_label = QLabel("Typography", container)
         #typography_label.setProperty("sidebarSection", "typography")
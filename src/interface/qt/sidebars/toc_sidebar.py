@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 try:  # pragma: no cover - only imported when Qt is available
-    from PySide6.QtWidgets import QHBoxLayout, QLabel, QVBoxLayout, QWidget, QSizePolicy
+    from PySide6.QtWidgets import QLabel, QWidget, QSizePolicy
 except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
     raise SystemExit("PySide6 must be installed to use the sidebar widgets.") from exc
 
+from interface.qt.styling.layout_utils import hbox, vbox
 from interface.qt.styling.theme.widget_tokens import SidebarTokens
 
 class TocSidebarWidget(QWidget):
@@ -17,17 +18,17 @@ class TocSidebarWidget(QWidget):
         self.setObjectName("TocSidebarPanel")
         self.setAutoFillBackground(True)
         self._tokens = tokens
-        self._build_ui()
+        self._built = False
+
+    def showEvent(self, event) -> None:
+        # Nothing here is needed until the dock is first opened.
+        if not self._built:
+            self._built = True
+            self._build_ui()
+        super().showEvent(event)
 
     def _build_ui(self) -> None:
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(
-            self._tokens.layout_root_margin_left,
-            self._tokens.layout_root_margin_top,
-            self._tokens.layout_root_margin_right,
-            self._tokens.layout_root_margin_bottom,
-        )
-        layout.setSpacing(0)
+        layout = vbox(self, self._tokens.root_margins)
 
         toolbar = self._build_toolbar()
         layout.addWidget(toolbar)
@@ -42,14 +43,7 @@ class TocSidebarWidget(QWidget):
         toolbar.setMinimumHeight(self._tokens.sidebar_toolbar_min_height)
         toolbar.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
 
-        toolbar_layout = QHBoxLayout(toolbar)
-        toolbar_layout.setContentsMargins(
-            self._tokens.layout_toolbar_margin_left,
-            self._tokens.layout_toolbar_margin_top,
-            self._tokens.layout_toolbar_margin_right,
-            self._tokens.layout_toolbar_margin_bottom,
-        )
-        toolbar_layout.setSpacing(8)
+        toolbar_layout = hbox(toolbar, self._tokens.toolbar_margins, 8)
         toolbar_layout.addWidget(QLabel("Table of Contents", toolbar))
         toolbar_layout.addStretch()
         return toolbar
@@ -59,14 +53,7 @@ class TocSidebarWidget(QWidget):
         content.setProperty("sidebarRole", "content")
         content.setAutoFillBackground(True)
 
-        content_layout = QVBoxLayout(content)
-        content_layout.setContentsMargins(
-            self._tokens.layout_content_margin_left,
-            self._tokens.layout_content_margin_top,
-            self._tokens.layout_content_margin_right,
-            self._tokens.layout_content_margin_bottom,
-        )
-        content_layout.setSpacing(8)
+        content_layout = vbox(content, self._tokens.content_margins, 8)
 
         placeholder = QLabel("This sidepanel will contain the table of content.", content)
         placeholder.setWordWrap(True)
@@ -0,0 +1,31 @@
+"""Small factories for box layouts preset from layout tokens."""
+
+from __future__ import annotations
+
+try:  # pragma: no cover - only imported when Qt is available
+    from PySide6.QtWidgets import QHBoxLayout, QVBoxLayout, QWidget
+except ModuleNotFoundError as exc:  # pragma: no cover - runtime guard
+    raise SystemExit("PySide6 must be installed to build Qt layouts.") from exc
+
+Margins = tuple[int, int, int, int]
+
+
+def vbox(parent: QWidget | None, margins: Margins, spacing: int = 0) -> QVBoxLayout:
+    """Return a ``QVBoxLayout`` on ``parent`` with margins and spacing applied."""
+
+    layout = QVBoxLayout(parent)
+    layout.setContentsMargins(*margins)
+    layout.setSpacing(spacing)
+    return layout
+
+
+def hbox(parent: QWidget | None, margins: Margins, spacing: int = 0) -> QHBoxLayout:
+    """Return a ``QHBoxLayout`` on ``parent`` with margins and spacing applied."""
+
+    layout = QHBoxLayout(parent)
+    layout.setContentsMargins(*margins)
+    layout.setSpacing(spacing)
+    return layout
+
+
+__all__ = ["Margins", "hbox", "vbox"]
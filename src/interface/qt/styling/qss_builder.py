@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable, Protocol
 
 from interface.qt.styling.theme import Metrics, Theme, ThemeMode, get_theme
@@ -54,8 +55,8 @@ def _base_style(theme: Theme) -> str:
         color: {text.primary};
     }}
 
-    QDockWidget#NotebooksDock QListWidget,
-    QDockWidget#SettingsDock QListWidget {{
+    QDockWidget#NotebooksDock QListView,
+    QDockWidget#SettingsDock QListView {{
         color: {text.primary};
     }}
 
@@ -74,6 +75,11 @@ def _collect_qss(modules: Iterable, theme: Theme) -> str:
     return "\n\n".join(blocks)
 
 
+@lru_cache(maxsize=4)
+def _application_qss(theme: Theme) -> str:
+    return _collect_qss(STYLE_MODULES, theme)
+
+
 def build_application_qss(
     mode: ThemeMode = ThemeMode.DARK,
     theme: Theme | None = None,
@@ -82,8 +88,7 @@ def build_application_qss(
 ) -> str:
     """Expose concatenated QSS string for use in tests or debugging."""
 
-    theme = theme or get_theme(mode, metrics=metrics)
-    return _collect_qss(STYLE_MODULES, theme)
+    return _application_qss(theme or get_theme(mode, metrics=metrics))
 
 
 class _HasStyleSheet(Protocol):
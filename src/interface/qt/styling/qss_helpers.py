@@ -0,0 +1,29 @@
+"""Helpers for emitting compact QSS declarations."""
+
+from __future__ import annotations
+
+# Declarations continue at the 4-space indent the QSS templates use.
+_DECLARATION_SEP = "\n    "
+
+
+def border_css(widths: tuple[int, int, int, int], color: str) -> str:
+    """Return border declarations for ``(left, top, right, bottom)`` widths.
+
+    Equal widths collapse to a single ``border`` shorthand; otherwise one
+    declaration per side is emitted.
+    """
+
+    left, top, right, bottom = widths
+    if left == top == right == bottom:
+        return f"border: {top}px solid {color};"
+    return _DECLARATION_SEP.join(
+        (
+            f"border-top: {top}px solid {color};",
+            f"border-bottom: {bottom}px solid {color};",
+            f"border-left: {left}px solid {color};",
+            f"border-right: {right}px solid {color};",
+        )
+    )
+
+
+__all__ = ["border_css"]
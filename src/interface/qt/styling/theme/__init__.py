@@ -24,6 +24,7 @@ from .widget_tokens import (
     SidebarTokens,
     StatusBarTokens,
     MainToolbarTokens,
+    ThemeTokens,
     button_tokens,
     cell_container_tokens,
     cell_gutter_tokens,
@@ -31,6 +32,7 @@ from .widget_tokens import (
     sidebar_tokens,
     statusbar_tokens,
     main_toolbar_tokens,
+    theme_tokens,
 )
 
 __all__ = [
@@ -55,6 +57,7 @@ __all__ = [
     "SidebarTokens",
     "StatusBarTokens",
     "MainToolbarTokens",
+    "ThemeTokens",
     "button_tokens",
     "cell_container_tokens",
     "cell_gutter_tokens",
@@ -62,4 +65,5 @@ __all__ = [
     "sidebar_tokens",
     "statusbar_tokens",
     "main_toolbar_tokens",
+    "theme_tokens",
 ]
@@ -2,21 +2,42 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import NamedTuple, TypeVar
 
 from .metrics import Metrics
 from .mode import ThemeMode
+from .widget_tokens import ThemeTokens, theme_tokens
 
 
-@dataclass(frozen=True)
 class ModeAwareColor:
-    """Represents a color that supports both light and dark variants."""
+    """Represents a color that supports both light and dark variants.
+
+    A plain slotted class rather than a dataclass: dozens of these are built at
+    import and only ever read through :meth:`value_for`. Color strings are
+    interned, so the many repeated hex values share a single object.
+    """
+
+    __slots__ = ("_pair",)
+
+    def __init__(self, light: str, dark: str) -> None:
+        self._pair = (sys.intern(light), sys.intern(dark))
+
+    @property
+    def light(self) -> str:
+        return self._pair[0]
 
-    light: str
-    dark: str
+    @property
+    def dark(self) -> str:
+        return self._pair[1]
 
     def value_for(self, mode: ThemeMode) -> str:
-        return self.light if mode == ThemeMode.LIGHT else self.dark
+        return self._pair[mode]
+
+    def __repr__(self) -> str:
+        return f"ModeAwareColor(light={self.light!r}, dark={self.dark!r})"
 
     def __str__(self) -> str:  # pragma: no cover - convenience for debugging
         return self.dark
@@ -141,20 +162,20 @@ class _BGTokens:
 
 
 class _BorderTokens:
-    transparent_border = ModeAwareColor(light=app_bg_light, dark=app_bg_dark)
-    subtle_border = ModeAwareColor(light=subtle_border_light, dark=subtle_border_dark)
-    normal_border = ModeAwareColor(light=normal_border_light, dark=normal_border_dark)
-    hover_border = ModeAwareColor(light=hover_item_border_light, dark=hover_item_border_dark)
-    pressed_border = ModeAwareColor(light=item_pressed_border_light, dark=item_pressed_border_dark)
-    selected_border = ModeAwareColor(light=selected_item_border_light, dark=selected_item_border_dark)
-    cell_border = ModeAwareColor(light=subtle_border_light, dark=subtle_border_dark)
-    cell_hover_border = ModeAwareColor(light=hover_cell_border_light, dark=hover_cell_border_dark)
-    cell_pressed_border = ModeAwareColor(light=cell_pressed_border_light, dark=cell_pressed_border_dark)
-    cell_in_focus_border = ModeAwareColor(light=selected_cell_border_light, dark=selected_cell_border_dark)
-    cell_gutter_border = ModeAwareColor(light="#d5d5d5", dark="#2a2a2a")
-    gutter_hover_border = ModeAwareColor(light=hover_gutter_border_light, dark=hover_gutter_border_dark)
-    gutter_pressed_border = ModeAwareColor(light=gutter_pressed_border_light, dark=gutter_pressed_border_dark)
-    gutter_in_focus_border = ModeAwareColor(light=selected_gutter_border_light, dark=selected_gutter_border_dark)
+    transparent = ModeAwareColor(light=app_bg_light, dark=app_bg_dark)
+    subtle = ModeAwareColor(light=subtle_border_light, dark=subtle_border_dark)
+    strong = ModeAwareColor(light=normal_border_light, dark=normal_border_dark)
+    hover = ModeAwareColor(light=hover_item_border_light, dark=hover_item_border_dark)
+    pressed = ModeAwareColor(light=item_pressed_border_light, dark=item_pressed_border_dark)
+    selected = ModeAwareColor(light=selected_item_border_light, dark=selected_item_border_dark)
+    cell = ModeAwareColor(light=subtle_border_light, dark=subtle_border_dark)
+    cell_hover = ModeAwareColor(light=hover_cell_border_light, dark=hover_cell_border_dark)
+    cell_pressed = ModeAwareColor(light=cell_pressed_border_light, dark=cell_pressed_border_dark)
+    cell_in_focus = ModeAwareColor(light=selected_cell_border_light, dark=selected_cell_border_dark)
+    cell_gutter = ModeAwareColor(light="#d5d5d5", dark="#2a2a2a")
+    gutter_hover = ModeAwareColor(light=hover_gutter_border_light, dark=hover_gutter_border_dark)
+    gutter_pressed = ModeAwareColor(light=gutter_pressed_border_light, dark=gutter_pressed_border_dark)
+    gutter_in_focus = ModeAwareColor(light=selected_gutter_border_light, dark=selected_gutter_border_dark)
 
 
 class _TextTokens:
@@ -180,16 +201,26 @@ class ButtonPaletteTokens:
     border: ModeAwareColor
     text: ModeAwareColor
     focus: ModeAwareColor
+    # Resolved palette per mode; filled on first resolve().
+    _cache: dict[ThemeMode, "ButtonPalette"] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def resolve(self, mode: ThemeMode) -> "ButtonPalette":
+        palette = self._cache.get(mode)
+        if palette is None:
+            palette = self._cache[mode] = self._build(mode)
+        return palette
+
+    def _build(self, mode: ThemeMode) -> "ButtonPalette":
         return ButtonPalette(
-            normal=self.normal.value_for(mode),
-            hover=self.hover.value_for(mode),
-            pressed=self.pressed.value_for(mode),
-            disabled=self.disabled.value_for(mode),
-            border=self.border.value_for(mode),
-            text=self.text.value_for(mode),
-            focus=self.focus.value_for(mode),
+            self.normal.value_for(mode),
+            self.hover.value_for(mode),
+            self.pressed.value_for(mode),
+            self.disabled.value_for(mode),
+            self.border.value_for(mode),
+            self.text.value_for(mode),
+            self.focus.value_for(mode),
         )
 
 
@@ -201,7 +232,7 @@ class _ButtonTokens:
         disabled=ModeAwareColor(light=button_disabled_bg_light, dark=button_disabled_bg_dark),
         border=ModeAwareColor(light=button_border_light, dark=button_border_dark),
         text=_TextTokens.primary,
-        focus=_BorderTokens.selected_border,
+        focus=_BorderTokens.selected,
     )
     main_toolbar = ButtonPaletteTokens( 
         normal=ModeAwareColor(light=button_bg_light, dark=button_bg_dark),
@@ -210,7 +241,7 @@ class _ButtonTokens:
         disabled=ModeAwareColor(light=button_disabled_bg_light, dark=button_disabled_bg_dark),
         border=ModeAwareColor(light="#dadada", dark="#404040"),
         text=_TextTokens.secondary,
-        focus=_BorderTokens.selected_border,
+        focus=_BorderTokens.selected,
     )
 
     sidebar_toolbar = ButtonPaletteTokens( 
@@ -220,7 +251,7 @@ class _ButtonTokens:
         disabled=ModeAwareColor(light=button_disabled_bg_light, dark=button_disabled_bg_dark),
         border=ModeAwareColor(light="#dadada", dark="#404040"),
         text=_TextTokens.secondary,
-        focus=_BorderTokens.selected_border,
+        focus=_BorderTokens.selected,
     )
 
     warning = ButtonPaletteTokens(
@@ -257,7 +288,7 @@ class _ButtonTokens:
         disabled=ModeAwareColor(light=button_disabled_bg_light, dark=button_disabled_bg_dark),
         border=ModeAwareColor(light=button_border_light, dark="#5a5a5a"),
         text=_TextTokens.primary,
-        focus=_BorderTokens.selected_border,
+        focus=_BorderTokens.selected,
     )
 
 
@@ -265,18 +296,17 @@ class _MenuTokens:
     background = _BGTokens.menubar_bg
     text = _TextTokens.primary
     item_hover = ModeAwareColor(light=hover_item_bg_light, dark=hover_item_bg_dark)
-    separator = _BorderTokens.subtle_border
+    separator = _BorderTokens.subtle
 
 
 class _StatusBarTokens:
     background = _BGTokens.statusbar_bg
     text = _TextTokens.secondary
-    border_top = _BorderTokens.subtle_border
+    border_top = _BorderTokens.subtle
     warning = _TextTokens.warning
 
 
-@dataclass(frozen=True)
-class BackgroundPalette:
+class BackgroundPalette(NamedTuple):
     app_bg: str
     menubar_bg: str
     statusbar_bg: str
@@ -293,8 +323,7 @@ class BackgroundPalette:
     hover_bg: str
 
 
-@dataclass(frozen=True)
-class BorderPalette:
+class BorderPalette(NamedTuple):
     transparent: str
     subtle: str
     strong: str
@@ -311,24 +340,21 @@ class BorderPalette:
     gutter_in_focus: str
 
 
-@dataclass(frozen=True)
-class TextPalette:
+class TextPalette(NamedTuple):
     primary: str
     secondary: str
     muted: str
     warning: str
 
 
-@dataclass(frozen=True)
-class ViewportPalette:
+class ViewportPalette(NamedTuple):
     base: str
     alternate: str
     selection: str
     selection_text: str
 
 
-@dataclass(frozen=True)
-class ButtonPalette:
+class ButtonPalette(NamedTuple):
     normal: str
     hover: str
     pressed: str
@@ -338,8 +364,7 @@ class ButtonPalette:
     focus: str
 
 
-@dataclass(frozen=True)
-class ButtonPalettes:
+class ButtonPalettes(NamedTuple):
     primary: ButtonPalette
     main_toolbar: ButtonPalette
     sidebar_toolbar: ButtonPalette
@@ -349,16 +374,14 @@ class ButtonPalettes:
     stop: ButtonPalette
 
 
-@dataclass(frozen=True)
-class MenuPalette:
+class MenuPalette(NamedTuple):
     background: str
     text: str
     item_hover: str
     separator: str
 
 
-@dataclass(frozen=True)
-class StatusBarPalette:
+class StatusBarPalette(NamedTuple):
     background: str
     text: str
     border_top: str
@@ -377,115 +400,62 @@ class Theme:
     statusbar: StatusBarPalette
     metrics: Metrics
 
+    @property
+    def tokens(self) -> ThemeTokens:
+        """Widget spacing/border tokens for this theme's metrics (cached)."""
 
-def _resolve_bg(mode: ThemeMode) -> BackgroundPalette:
-    tokens = _BGTokens
-    return BackgroundPalette(
-        app_bg=tokens.app_bg.value_for(mode),
-        menubar_bg=tokens.menubar_bg.value_for(mode),
-        statusbar_bg=tokens.statusbar_bg.value_for(mode),
-        dropdown_bg=tokens.dropdown_bg.value_for(mode),
-        cell_bg=tokens.cell_bg.value_for(mode),
-        cell_selected_bg=tokens.cell_selected_bg.value_for(mode),
-        cell_gutter_bg=tokens.cell_gutter_bg.value_for(mode),
-        selected_gutter_bg=tokens.selected_gutter_bg.value_for(mode),
-        toolbar_bg=tokens.toolbar_bg.value_for(mode),
-        sidebar_bg=tokens.sidebar_bg.value_for(mode),
-        sidebar_header_bg=tokens.sidebar_header_bg.value_for(mode),
-        sidebar_content_bg=tokens.sidebar_content_bg.value_for(mode),
-        sidebar_toolbar_bg=tokens.sidebar_toolbar_bg.value_for(mode),
-        hover_bg=tokens.hover_bg.value_for(mode),
-    )
+        return theme_tokens(self.metrics)
 
 
-def _resolve_border(mode: ThemeMode) -> BorderPalette:
-    tokens = _BorderTokens
-    return BorderPalette(
-        transparent=tokens.transparent_border.value_for(mode),
-        subtle=tokens.subtle_border.value_for(mode),
-        strong=tokens.normal_border.value_for(mode),
-        hover=tokens.hover_border.value_for(mode),
-        pressed=tokens.pressed_border.value_for(mode),
-        selected=tokens.selected_border.value_for(mode),
-        cell=tokens.cell_border.value_for(mode),
-        cell_hover=tokens.cell_hover_border.value_for(mode),
-        cell_pressed=tokens.cell_pressed_border.value_for(mode),
-        cell_in_focus=tokens.cell_in_focus_border.value_for(mode),
-        cell_gutter=tokens.cell_gutter_border.value_for(mode),
-        gutter_hover=tokens.gutter_hover_border.value_for(mode),
-        gutter_pressed=tokens.gutter_pressed_border.value_for(mode),
-        gutter_in_focus=tokens.gutter_in_focus_border.value_for(mode),
-    )
-
+_Palette = TypeVar("_Palette", bound=tuple)
 
-def _resolve_text(mode: ThemeMode) -> TextPalette:
-    tokens = _TextTokens
-    return TextPalette(
-        primary=tokens.primary.value_for(mode),
-        secondary=tokens.secondary.value_for(mode),
-        muted=tokens.muted.value_for(mode),
-        warning=tokens.warning.value_for(mode),
-    )
 
+def _materialize(tokens: type, palette_cls: type[_Palette], mode: ThemeMode) -> _Palette:
+    """Build ``palette_cls`` from the same-named ``ModeAwareColor``s on ``tokens``."""
 
-def _resolve_viewport(mode: ThemeMode) -> ViewportPalette:
-    tokens = _ViewportTokens
-    return ViewportPalette(
-        base=tokens.base.value_for(mode),
-        alternate=tokens.alternate.value_for(mode),
-        selection=tokens.selection.value_for(mode),
-        selection_text=tokens.selection_text.value_for(mode),
-    )
+    return palette_cls(*(getattr(tokens, name).value_for(mode) for name in palette_cls._fields))
 
 
 def _resolve_buttons(mode: ThemeMode) -> ButtonPalettes:
     tokens = _ButtonTokens
-    return ButtonPalettes(
-        primary=tokens.primary.resolve(mode),
-        main_toolbar=tokens.main_toolbar.resolve(mode),
-        sidebar_toolbar=tokens.sidebar_toolbar.resolve(mode),
-        menubar=tokens.menubar.resolve(mode),
-        warning=tokens.warning.resolve(mode),
-        run=tokens.run.resolve(mode),
-        stop=tokens.stop.resolve(mode),
-    )
+    return ButtonPalettes(*(getattr(tokens, name).resolve(mode) for name in ButtonPalettes._fields))
 
 
-def _resolve_menu(mode: ThemeMode) -> MenuPalette:
-    tokens = _MenuTokens
-    return MenuPalette(
-        background=tokens.background.value_for(mode),
-        text=tokens.text.value_for(mode),
-        item_hover=tokens.item_hover.value_for(mode),
-        separator=tokens.separator.value_for(mode),
+def _build_theme(mode: ThemeMode) -> Theme:
+    return Theme(
+        mode=mode,
+        bg=_materialize(_BGTokens, BackgroundPalette, mode),
+        border=_materialize(_BorderTokens, BorderPalette, mode),
+        text=_materialize(_TextTokens, TextPalette, mode),
+        viewport=_materialize(_ViewportTokens, ViewportPalette, mode),
+        buttons=_resolve_buttons(mode),
+        menu=_materialize(_MenuTokens, MenuPalette, mode),
+        statusbar=_materialize(_StatusBarTokens, StatusBarPalette, mode),
+        metrics=Metrics(),
     )
 
 
-def _resolve_statusbar(mode: ThemeMode) -> StatusBarPalette:
-    tokens = _StatusBarTokens
-    return StatusBarPalette(
-        background=tokens.background.value_for(mode),
-        text=tokens.text.value_for(mode),
-        border_top=tokens.border_top.value_for(mode),
-        warning=tokens.warning.value_for(mode),
-    )
+# Every palette is fixed at import time, so both themes are resolved once here
+# and get_theme() only has to pick one (and swap in custom metrics).
+_THEMES = {mode: _build_theme(mode) for mode in ThemeMode}
 
 
 def get_theme(mode: ThemeMode = ThemeMode.DARK, metrics: Metrics | None = None) -> Theme:
-    """Return a fully resolved palette for the requested theme mode."""
+    """Return a fully resolved palette for the requested theme mode.
 
-    metrics = metrics or Metrics()
-    return Theme(
-        mode=mode,
-        bg=_resolve_bg(mode),
-        border=_resolve_border(mode),
-        text=_resolve_text(mode),
-        viewport=_resolve_viewport(mode),
-        buttons=_resolve_buttons(mode),
-        menu=_resolve_menu(mode),
-        statusbar=_resolve_statusbar(mode),
-        metrics=metrics,
-    )
+    Themes are immutable, so the same instance is returned for repeated
+    ``(mode, metrics)`` requests.
+    """
+
+    theme = _THEMES[mode]
+    if metrics is None or metrics == theme.metrics:
+        return theme
+    return _with_metrics(mode, metrics)
+
+
+@lru_cache(maxsize=8)
+def _with_metrics(mode: ThemeMode, metrics: Metrics) -> Theme:
+    return replace(_THEMES[mode], metrics=metrics)
 
 
 __all__ = [
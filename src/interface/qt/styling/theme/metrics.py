@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 
 from .sizing import cell_row_min_height_for_font, toolbar_min_height_for_font
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class Metrics:
-    """Spacing, sizing, and typography metrics shared by all styles."""
+    """Spacing, sizing, and typography metrics shared by all styles.
+
+    Treat instances as immutable: derive variants with ``dataclasses.replace``.
+    They are hashed (and used as cache keys) by value; the hash is computed
+    once at construction.
+    """
 
     test_value: int = 80  # Temporary debug token
 
@@ -66,6 +72,31 @@ class Metrics:
     border_width_medium: int = 2
     border_width_large: int = 4
 
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._hash = hash(tuple(getattr(self, name) for name in _HASHED_FIELDS))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+
+_HASHED_FIELDS = tuple(f.name for f in fields(Metrics) if f.compare)
+_METRICS_FIELDS = tuple(f.name for f in fields(Metrics) if f.init)
+
+# Shared default template; never mutate it.
+_DEFAULT_METRICS = Metrics()
+
+
+def _derive(base: Metrics, **changes: object) -> Metrics:
+    """Like ``dataclasses.replace`` but copies fields from a precomputed name list."""
+
+    values = {name: getattr(base, name) for name in _METRICS_FIELDS}
+    values.update(changes)
+    return Metrics(**values)
+
+
+@lru_cache(maxsize=8)
 def build_metrics_for_ui_font(
     ui_point_size: int,
     *,
@@ -73,14 +104,17 @@ def build_metrics_for_ui_font(
     small_offset: int = 2,
     large_offset: int = 2,
 ) -> "Metrics":
-    """Return a Metrics instance adjusted to the requested UI font size."""
+    """Return a Metrics instance adjusted to the requested UI font size.
+
+    Results are cached per argument set and shared, so never mutate them.
+    """
 
-    base = template or Metrics()
+    base = template or _DEFAULT_METRICS
     adjusted_small = max(ui_point_size - small_offset, 6)
     adjusted_large = ui_point_size + large_offset
     toolbar_min_height = toolbar_min_height_for_font(ui_point_size)
     cell_row_min_height = cell_row_min_height_for_font(base.cell_body_font_size)
-    return replace(
+    return _derive(
         base,
         font_size_small=adjusted_small,
         font_size_medium=ui_point_size,
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
-from enum import Enum
+from enum import IntEnum
 
 
-class ThemeMode(str, Enum):
-    """Available theme modes."""
+class ThemeMode(IntEnum):
+    """Available theme modes.
 
-    LIGHT = "light"
-    DARK = "dark"
+    Members are ints and index ``(light, dark)`` color pairs directly; use
+    ``mode.name.lower()`` for the user-facing ``"light"``/``"dark"`` spelling.
+    """
+
+    LIGHT = 0
+    DARK = 1
 
 
 __all__ = ["ThemeMode"]
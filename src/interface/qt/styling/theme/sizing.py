@@ -2,21 +2,33 @@
 
 from __future__ import annotations
 
-from math import ceil
 
+def _ceil_div(numerator: int, denominator: int) -> int:
+    return -(-numerator // denominator)
 
-def toolbar_min_height_for_font(ui_point_size: int, *, min_height: int = 28, scale: float = 2.0) -> int:
+
+def _percent(scale: float) -> int:
+    return round(scale * 100)
+
+
+def toolbar_min_height_for_font(
+    ui_point_size: int,
+    *,
+    min_height: int = 28,
+    scale: float = 2.0,
+) -> int:
     """Return a reasonable minimum toolbar height for the given UI font size.
 
     The value is proportional to the selected point size so menubars, toolbars,
     and sidebar toolbars do not collapse when the overall window height is small.
     The default scale/min height values are tuned for Segoe UI/Noto Sans, but can
-    be tweaked if the typography system changes later.
+    be tweaked if the typography system changes later. Scales are applied as
+    whole percentages in integer arithmetic.
     """
 
     if ui_point_size <= 0:
         return min_height
-    scaled = ceil(ui_point_size * scale)
+    scaled = _ceil_div(ui_point_size * _percent(scale), 100)
     return max(min_height, scaled)
 
 
@@ -36,9 +48,8 @@ def cell_row_min_height_for_font(
 
     if body_point_size <= 0:
         return min_height
-    line_height = body_point_size * line_height_scale
-    content_height = line_height * max(1, min_lines)
-    scaled = ceil(content_height + padding)
+    content_height = body_point_size * _percent(line_height_scale) * max(1, min_lines)
+    scaled = _ceil_div(content_height + padding * 100, 100)
     return max(min_height, scaled)
 
 
@@ -2,7 +2,9 @@
 
 This package provides structured token classes for various UI widgets.
 Each module contains a dataclass defining the spacing/border properties
-and a factory function to construct it from Metrics.
+and a factory function to construct it from Metrics. Factories are cached
+per Metrics value, so callers share one token instance and must not mutate
+it.
 """
 
 from .button_tokens import ButtonTokens, button_tokens
@@ -14,6 +16,7 @@ from .main_menubar_tokens import MenuBarTokens, menubar_tokens
 from .main_toolbar_tokens import MainToolbarTokens, main_toolbar_tokens
 from .sidebar_tokens import SidebarTokens, sidebar_tokens
 from .statusbar_tokens import StatusBarTokens, statusbar_tokens
+from .theme_tokens import ThemeTokens, theme_tokens
 
 __all__ = [
     # Classes
@@ -26,6 +29,7 @@ __all__ = [
     "MainToolbarTokens",
     "SidebarTokens",
     "StatusBarTokens",
+    "ThemeTokens",
     # Factory functions
     "button_tokens",
     "cell_container_tokens",
@@ -36,4 +40,5 @@ __all__ = [
     "main_toolbar_tokens",
     "sidebar_tokens",
     "statusbar_tokens",
+    "theme_tokens",
 ]
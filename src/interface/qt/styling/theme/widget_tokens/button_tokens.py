@@ -1,13 +1,12 @@
 """Button spacing and border tokens derived from Metrics."""
 
-from __future__ import annotations
-
 from dataclasses import dataclass
+from functools import lru_cache
 
 from ..metrics import Metrics
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class ButtonTokens:
     main_menubar_border_width: int
     main_menubar_padding_top: int
@@ -34,31 +33,36 @@ class ButtonTokens:
     sidebar_toolbar_radius: int
 
 
+@lru_cache(maxsize=4)
 def button_tokens(metrics: Metrics) -> ButtonTokens:
+    padding_small = metrics.padding_small
+    border_width_small = metrics.border_width_small
+    radius_small = metrics.radius_small
+
     return ButtonTokens(
-        main_menubar_border_width=metrics.border_width_small,
-        main_menubar_padding_top=metrics.padding_small,
-        main_menubar_padding_bottom=metrics.padding_small,
-        main_menubar_padding_left=metrics.padding_small,
-        main_menubar_padding_right=metrics.padding_small,
+        main_menubar_border_width=border_width_small,
+        main_menubar_padding_top=padding_small,
+        main_menubar_padding_bottom=padding_small,
+        main_menubar_padding_left=padding_small,
+        main_menubar_padding_right=padding_small,
         main_menubar_min_height=metrics.min_main_menubar_height,
-        main_menubar_radius=metrics.radius_small,
+        main_menubar_radius=radius_small,
 
-        main_toolbar_border_width=metrics.border_width_small,
-        main_toolbar_padding_top=metrics.padding_small,
-        main_toolbar_padding_bottom=metrics.padding_small,
-        main_toolbar_padding_left=metrics.padding_small,
-        main_toolbar_padding_right=metrics.padding_small,
+        main_toolbar_border_width=border_width_small,
+        main_toolbar_padding_top=padding_small,
+        main_toolbar_padding_bottom=padding_small,
+        main_toolbar_padding_left=padding_small,
+        main_toolbar_padding_right=padding_small,
         main_toolbar_min_height=metrics.min_main_toolbar_height,
-        main_toolbar_radius=metrics.radius_small,
+        main_toolbar_radius=radius_small,
 
-        sidebar_toolbar_border_width=metrics.border_width_small,
-        sidebar_toolbar_padding_top=metrics.padding_small,
-        sidebar_toolbar_padding_bottom=metrics.padding_small,
-        sidebar_toolbar_padding_left=metrics.padding_small,
-        sidebar_toolbar_padding_right=metrics.padding_small,
+        sidebar_toolbar_border_width=border_width_small,
+        sidebar_toolbar_padding_top=padding_small,
+        sidebar_toolbar_padding_bottom=padding_small,
+        sidebar_toolbar_padding_left=padding_small,
+        sidebar_toolbar_padding_right=padding_small,
         sidebar_toolbar_min_height=metrics.min_sidebar_toolbar_height,
-        sidebar_toolbar_radius=metrics.radius_small,
+        sidebar_toolbar_radius=radius_small,
     )
 
 
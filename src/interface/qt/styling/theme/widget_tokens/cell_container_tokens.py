@@ -1,52 +1,36 @@
 """Cell container spacing and border tokens derived from Metrics."""
 
-from __future__ import annotations
-
 from dataclasses import dataclass
+from functools import lru_cache
 
 from ..metrics import Metrics
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class CellContainerTokens:
     border_radius: int
     border_width: int
-    border_width_top: int
-    border_width_bottom: int
-    border_width_left: int
-    border_width_right: int
-    padding_top: int
-    padding_bottom: int
-    padding_left: int
-    padding_right: int
-    margin_top: int
-    margin_bottom: int
-    margin_left: int
-    margin_right: int
+    # Per-side values are (left, top, right, bottom), the order Qt uses.
+    border_widths: tuple[int, int, int, int]
+    padding: tuple[int, int, int, int]
+    margin: tuple[int, int, int, int]
     header_margin_bottom: int
 
 
+@lru_cache(maxsize=4)
 def cell_container_tokens(metrics: Metrics) -> CellContainerTokens:
+    border_width_small = metrics.border_width_small
+    margin_zero = metrics.margin_zero
+    padding_zero = metrics.padding_zero
+    padding_small = metrics.padding_small
+
     return CellContainerTokens(
         border_radius=metrics.radius_small,
-        border_width=metrics.border_width_small,
-        
-        border_width_top=metrics.border_width_small,  
-        border_width_bottom=metrics.border_width_small,
-        border_width_left=metrics.border_width_small,
-        border_width_right=metrics.border_width_small,
-
-        padding_top=metrics.padding_zero,
-        padding_bottom=metrics.padding_zero,
-        padding_left=metrics.padding_small,
-        padding_right=metrics.padding_small,
-
-        margin_top=metrics.margin_zero,    # Do this affect multiple margins?
-        margin_bottom=metrics.margin_zero,
-        margin_left=metrics.margin_zero,
-        margin_right=metrics.margin_zero,
-
-        header_margin_bottom=metrics.padding_small,
+        border_width=border_width_small,
+        border_widths=(border_width_small,) * 4,
+        padding=(padding_small, padding_zero, padding_small, padding_zero),
+        margin=(margin_zero,) * 4,    # Do this affect multiple margins?
+        header_margin_bottom=padding_small,
     )
 
 
@@ -1,14 +1,12 @@
 """Layout tokens for the vertical list that contains cell rows."""
 
-from __future__ import annotations
-
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple
 
 from ..metrics import Metrics
 
 
-@dataclass(frozen=True)
-class CellListTokens:
+class CellListTokens(NamedTuple):
     content_margin_top: int
     content_margin_bottom: int
     content_margin_left: int
@@ -16,13 +14,16 @@ class CellListTokens:
     content_spacing: int
 
 
+@lru_cache(maxsize=4)
 def cell_list_tokens(metrics: Metrics) -> CellListTokens:
+    padding_zero = metrics.padding_zero
+
     return CellListTokens(
-        content_margin_top=metrics.padding_zero,
-        content_margin_bottom=metrics.padding_zero,
-        content_margin_left=metrics.padding_zero,
-        content_margin_right=metrics.padding_zero,
-        content_spacing=metrics.padding_zero,  # SPACING BETWEEN CELLS
+        content_margin_top=padding_zero,
+        content_margin_bottom=padding_zero,
+        content_margin_left=padding_zero,
+        content_margin_right=padding_zero,
+        content_spacing=padding_zero,  # SPACING BETWEEN CELLS
     )
 
 
@@ -3,14 +3,13 @@
 # The class is located in main_window.py.
 
 
-from __future__ import annotations
-
 from dataclasses import dataclass
+from functools import lru_cache
 
 from ..metrics import Metrics
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class CellRowTokens:
     gutter_gap: int
 
@@ -28,19 +27,23 @@ class CellRowTokens:
     cell_row_margin_left: int
     cell_row_margin_right: int
 
+@lru_cache(maxsize=4)
 def cell_row_tokens(metrics: Metrics) -> CellRowTokens:
+    padding_zero = metrics.padding_zero
+    margin_zero = metrics.margin_zero
+
     return CellRowTokens(
-        gutter_gap=metrics.padding_zero,
-        cell_row_spacing=metrics.padding_zero,
+        gutter_gap=padding_zero,
+        cell_row_spacing=padding_zero,
         cell_row_min_height=metrics.cell_row_min_height,
-        cell_row_padding_top=metrics.padding_zero,
-        cell_row_padding_bottom=metrics.padding_zero,
-        cell_row_padding_left=metrics.padding_zero,
-        cell_row_padding_right=metrics.padding_zero,
-        cell_row_margin_top=metrics.margin_zero,
-        cell_row_margin_bottom=metrics.margin_zero,
-        cell_row_margin_left=metrics.margin_zero,
-        cell_row_margin_right=metrics.margin_zero,
+        cell_row_padding_top=padding_zero,
+        cell_row_padding_bottom=padding_zero,
+        cell_row_padding_left=padding_zero,
+        cell_row_padding_right=padding_zero,
+        cell_row_margin_top=margin_zero,
+        cell_row_margin_bottom=margin_zero,
+        cell_row_margin_left=margin_zero,
+        cell_row_margin_right=margin_zero,
     )
 
 __all__ = ["CellRowTokens", "cell_row_tokens"]
@@ -1,13 +1,12 @@
 """Main menubar spacing and border tokens derived from Metrics."""
 
-from __future__ import annotations
-
 from dataclasses import dataclass
+from functools import lru_cache
 
 from ..metrics import Metrics
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class MenuBarTokens:
     border_width: int
     spacing: int
@@ -32,35 +31,40 @@ class MenuBarTokens:
     dropdown_separator_margin_y: int
 
 
+@lru_cache(maxsize=4)
 def menubar_tokens(metrics: Metrics) -> MenuBarTokens:
+    padding_small = metrics.padding_small
+    padding_medium = metrics.padding_medium
+    padding_zero = metrics.padding_zero
+
     return MenuBarTokens(
         border_width=metrics.border_width_zero,
         
-        spacing=metrics.padding_small,
+        spacing=padding_small,
 
-        padding_top=metrics.padding_small,
-        padding_bottom=metrics.padding_small,
-        padding_left=metrics.padding_small,
-        padding_right=metrics.padding_small,
+        padding_top=padding_small,
+        padding_bottom=padding_small,
+        padding_left=padding_small,
+        padding_right=padding_small,
 
-        margin_top=metrics.padding_zero,
-        margin_bottom=metrics.padding_zero,
-        margin_left=metrics.padding_zero,
-        margin_right=metrics.padding_zero,
+        margin_top=padding_zero,
+        margin_bottom=padding_zero,
+        margin_left=padding_zero,
+        margin_right=padding_zero,
 
         min_height=metrics.min_main_menubar_height,
 
         # Menubar item paddings (File, Edit, View, etc.)
-        item_padding_top=metrics.padding_small,
-        item_padding_bottom=metrics.padding_small,
-        item_padding_right=metrics.padding_medium,
-        item_padding_left=metrics.padding_medium,
+        item_padding_top=padding_small,
+        item_padding_bottom=padding_small,
+        item_padding_right=padding_medium,
+        item_padding_left=padding_medium,
 
         # Dropdown menu and dropdown items paddings
-        dropdown_menu_padding_top=metrics.padding_medium,
-        dropdown_menu_padding_bottom=metrics.padding_medium,
-        dropdown_menu_padding_left=metrics.padding_medium,
-        dropdown_menu_padding_right=metrics.padding_medium,
+        dropdown_menu_padding_top=padding_medium,
+        dropdown_menu_padding_bottom=padding_medium,
+        dropdown_menu_padding_left=padding_medium,
+        dropdown_menu_padding_right=padding_medium,
 
         dropdown_separator_margin_x=metrics.padding_large,
         dropdown_separator_margin_y=metrics.padding_extra_small,
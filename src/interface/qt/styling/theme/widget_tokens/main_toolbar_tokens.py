@@ -1,13 +1,12 @@
 """Main toolbar spacing and border tokens derived from Metrics."""
 
-from __future__ import annotations
-
 from dataclasses import dataclass
+from functools import lru_cache
 
 from ..metrics import Metrics
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class MainToolbarTokens:
     border_width: int
     border_radius: int
@@ -23,22 +22,26 @@ class MainToolbarTokens:
     min_height: int
 
 
+@lru_cache(maxsize=4)
 def main_toolbar_tokens(metrics: Metrics) -> MainToolbarTokens:
+    padding_zero = metrics.padding_zero
+    padding_small = metrics.padding_small
+
     return MainToolbarTokens(
         border_width=metrics.border_width_zero,
         border_radius=metrics.radius_zero,
         
-        spacing=metrics.padding_small,
+        spacing=padding_small,
 
-        padding_top=metrics.padding_zero,
-        padding_bottom=metrics.padding_small,
-        padding_left=metrics.padding_small,
-        padding_right=metrics.padding_small,
+        padding_top=padding_zero,
+        padding_bottom=padding_small,
+        padding_left=padding_small,
+        padding_right=padding_small,
         
-        margin_top=metrics.padding_zero,
-        margin_bottom=metrics.padding_zero,
-        margin_left=metrics.padding_zero,
-        margin_right=metrics.padding_zero,
+        margin_top=padding_zero,
+        margin_bottom=padding_zero,
+        margin_left=padding_zero,
+        margin_right=padding_zero,
 
         min_height=metrics.min_main_toolbar_height,
     )
@@ -1,13 +1,12 @@
 """Sidebar spacing and border tokens derived from Metrics."""
 
-from __future__ import annotations
-
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 from ..metrics import Metrics
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class SidebarTokens:
     # Sidebar container tokens
     sidebar_container_border_radius: int
@@ -100,37 +99,90 @@ class SidebarTokens:
     sidebar_content_item_margin_left: int
     sidebar_content_item_margin_right: int
 
-    # OLD TOKENS (kept for backward compatibility)
-    dock_border_width: int
-    header_padding: int
-    toolbar_padding: int
-    toolbar_border_width: int
-    action_row_radius: int
-    action_row_padding_y: int
-    action_row_padding_x: int
-    input_border_width: int
-    input_padding: int
-
-
+    # Layout margins in Qt's (left, top, right, bottom) order, ready for
+    # ``layout.setContentsMargins(*tokens.root_margins)``. Derived once from
+    # the per-side fields above.
+    root_margins: tuple[int, int, int, int] = field(init=False, repr=False)
+    toolbar_margins: tuple[int, int, int, int] = field(init=False, repr=False)
+    content_margins: tuple[int, int, int, int] = field(init=False, repr=False)
+    # Per-side border widths in the same order, for ``border_css``.
+    container_border_widths: tuple[int, int, int, int] = field(init=False, repr=False)
+    header_border_widths: tuple[int, int, int, int] = field(init=False, repr=False)
+    toolbar_border_widths: tuple[int, int, int, int] = field(init=False, repr=False)
+    content_border_widths: tuple[int, int, int, int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.root_margins = (
+            self.layout_root_margin_left,
+            self.layout_root_margin_top,
+            self.layout_root_margin_right,
+            self.layout_root_margin_bottom,
+        )
+        self.toolbar_margins = (
+            self.layout_toolbar_margin_left,
+            self.layout_toolbar_margin_top,
+            self.layout_toolbar_margin_right,
+            self.layout_toolbar_margin_bottom,
+        )
+        self.content_margins = (
+            self.layout_content_margin_left,
+            self.layout_content_margin_top,
+            self.layout_content_margin_right,
+            self.layout_content_margin_bottom,
+        )
+        self.container_border_widths = (
+            self.sidebar_container_border_width_left,
+            self.sidebar_container_border_width_top,
+            self.sidebar_container_border_width_right,
+            self.sidebar_container_border_width_bottom,
+        )
+        self.header_border_widths = (
+            self.sidebar_header_border_left_width,
+            self.sidebar_header_border_top_width,
+            self.sidebar_header_border_right_width,
+            self.sidebar_header_border_bottom_width,
+        )
+        self.toolbar_border_widths = (
+            self.sidebar_toolbar_border_left_width,
+            self.sidebar_toolbar_border_top_width,
+            self.sidebar_toolbar_border_right_width,
+            self.sidebar_toolbar_border_bottom_width,
+        )
+        self.content_border_widths = (
+            self.sidebar_content_border_left_width,
+            self.sidebar_content_border_top_width,
+            self.sidebar_content_border_right_width,
+            self.sidebar_content_border_bottom_width,
+        )
+
+
+@lru_cache(maxsize=4)
 def sidebar_tokens(metrics: Metrics) -> SidebarTokens:
+    # Bind the metrics read many times below to locals (one lookup each).
+    padding_medium = metrics.padding_medium
+    border_width_zero = metrics.border_width_zero
+    padding_small = metrics.padding_small
+    border_width_small = metrics.border_width_small
+    radius_zero = metrics.radius_zero
+
     return SidebarTokens(
         # Sidebar container tokens
-        sidebar_container_border_radius=metrics.radius_zero,
+        sidebar_container_border_radius=radius_zero,
 
-        sidebar_container_border_width_top=metrics.border_width_zero,
-        sidebar_container_border_width_bottom=metrics.border_width_zero,
-        sidebar_container_border_width_left=metrics.border_width_zero,
-        sidebar_container_border_width_right=metrics.border_width_zero,
+        sidebar_container_border_width_top=border_width_zero,
+        sidebar_container_border_width_bottom=border_width_zero,
+        sidebar_container_border_width_left=border_width_zero,
+        sidebar_container_border_width_right=border_width_zero,
 
-        sidebar_header_border_top_width=metrics.border_width_small,
-        sidebar_header_border_bottom_width=metrics.border_width_small,
-        sidebar_header_border_left_width=metrics.border_width_small,
-        sidebar_header_border_right_width=metrics.border_width_small,
+        sidebar_header_border_top_width=border_width_small,
+        sidebar_header_border_bottom_width=border_width_small,
+        sidebar_header_border_left_width=border_width_small,
+        sidebar_header_border_right_width=border_width_small,
 
-        sidebar_header_padding_top=metrics.padding_medium,
-        sidebar_header_padding_bottom=metrics.padding_medium,
-        sidebar_header_padding_left=metrics.padding_medium,
-        sidebar_header_padding_right=metrics.padding_medium,
+        sidebar_header_padding_top=padding_medium,
+        sidebar_header_padding_bottom=padding_medium,
+        sidebar_header_padding_left=padding_medium,
+        sidebar_header_padding_right=padding_medium,
 
         sidebar_header_margin_top=0,
         sidebar_header_margin_bottom=0,
@@ -138,57 +190,57 @@ def sidebar_tokens(metrics: Metrics) -> SidebarTokens:
         sidebar_header_margin_right=0,
 
         # Sidebar toolbar tokens
-        sidebar_toolbar_border_radius=metrics.radius_zero,
+        sidebar_toolbar_border_radius=radius_zero,
         sidebar_toolbar_min_height=metrics.min_sidebar_toolbar_height,
         
-        sidebar_toolbar_border_top_width=metrics.border_width_zero,
-        sidebar_toolbar_border_bottom_width=metrics.border_width_zero,
-        sidebar_toolbar_border_left_width=metrics.border_width_zero,
-        sidebar_toolbar_border_right_width=metrics.border_width_zero,
+        sidebar_toolbar_border_top_width=border_width_zero,
+        sidebar_toolbar_border_bottom_width=border_width_zero,
+        sidebar_toolbar_border_left_width=border_width_zero,
+        sidebar_toolbar_border_right_width=border_width_zero,
 
-        sidebar_toolbar_padding_top=metrics.padding_medium,
-        sidebar_toolbar_padding_bottom=metrics.padding_medium,
-        sidebar_toolbar_padding_left=metrics.padding_medium,
-        sidebar_toolbar_padding_right=metrics.padding_medium,
+        sidebar_toolbar_padding_top=padding_medium,
+        sidebar_toolbar_padding_bottom=padding_medium,
+        sidebar_toolbar_padding_left=padding_medium,
+        sidebar_toolbar_padding_right=padding_medium,
 
         sidebar_toolbar_margin_top=0,
         sidebar_toolbar_margin_bottom=0,
         sidebar_toolbar_margin_left=0,
         sidebar_toolbar_margin_right=0,
 
-        sidebar_toolbar_item_x_spacing=metrics.padding_small,
-        sidebar_toolbar_item_padding_top=metrics.padding_small,
-        sidebar_toolbar_item_padding_bottom=metrics.padding_small,
-        sidebar_toolbar_item_padding_left=metrics.padding_small,
-        sidebar_toolbar_item_padding_right=metrics.padding_small,
+        sidebar_toolbar_item_x_spacing=padding_small,
+        sidebar_toolbar_item_padding_top=padding_small,
+        sidebar_toolbar_item_padding_bottom=padding_small,
+        sidebar_toolbar_item_padding_left=padding_small,
+        sidebar_toolbar_item_padding_right=padding_small,
 
-        layout_root_margin_top=metrics.padding_medium,
-        layout_root_margin_bottom=metrics.padding_medium,
+        layout_root_margin_top=padding_medium,
+        layout_root_margin_bottom=padding_medium,
         layout_root_margin_left=metrics.padding_zero,
-        layout_root_margin_right=metrics.padding_medium,
+        layout_root_margin_right=padding_medium,
 
-        layout_header_margin_top=metrics.padding_medium,
-        layout_header_margin_bottom=metrics.padding_medium,
-        layout_header_margin_left=metrics.padding_medium,
-        layout_header_margin_right=metrics.padding_medium,
+        layout_header_margin_top=padding_medium,
+        layout_header_margin_bottom=padding_medium,
+        layout_header_margin_left=padding_medium,
+        layout_header_margin_right=padding_medium,
 
-        layout_toolbar_margin_top=metrics.padding_medium,
-        layout_toolbar_margin_bottom=metrics.padding_medium,
-        layout_toolbar_margin_left=metrics.padding_medium,
-        layout_toolbar_margin_right=metrics.padding_medium,
+        layout_toolbar_margin_top=padding_medium,
+        layout_toolbar_margin_bottom=padding_medium,
+        layout_toolbar_margin_left=padding_medium,
+        layout_toolbar_margin_right=padding_medium,
 
-        layout_content_margin_top=metrics.padding_medium,
-        layout_content_margin_bottom=metrics.padding_medium,
-        layout_content_margin_left=metrics.padding_medium,
-        layout_content_margin_right=metrics.padding_medium,
+        layout_content_margin_top=padding_medium,
+        layout_content_margin_bottom=padding_medium,
+        layout_content_margin_left=padding_medium,
+        layout_content_margin_right=padding_medium,
 
         # Sidebar content container tokens
-        sidebar_content_border_radius=metrics.radius_zero,
+        sidebar_content_border_radius=radius_zero,
         
-        sidebar_content_border_top_width=metrics.border_width_zero,
-        sidebar_content_border_bottom_width=metrics.border_width_zero,
-        sidebar_content_border_left_width=metrics.border_width_zero,
-        sidebar_content_border_right_width=metrics.border_width_zero,
+        sidebar_content_border_top_width=border_width_zero,
+        sidebar_content_border_bottom_width=border_width_zero,
+        sidebar_content_border_left_width=border_width_zero,
+        sidebar_content_border_right_width=border_width_zero,
 
         sidebar_content_margin_top=0,
         sidebar_content_margin_bottom=0,
@@ -197,34 +249,22 @@ def sidebar_tokens(metrics: Metrics) -> SidebarTokens:
         
         # Sidebar content item tokens (Common for Settings items and "select a notebook" items in the notebook list)
         # For now this is hardcoded in the src\interface\qt\sidebars-files
-        sidebar_content_item_border_top_width=metrics.border_width_zero,
-        sidebar_content_item_border_bottom_width=metrics.border_width_zero,
-        sidebar_content_item_border_left_width=metrics.border_width_zero,
-        sidebar_content_item_border_right_width=metrics.border_width_zero,
-
-        sidebar_content_item_x_spacing=metrics.padding_small,
-
-        sidebar_content_item_padding_top=metrics.padding_small,
-        sidebar_content_item_padding_bottom=metrics.padding_small,
-        sidebar_content_item_padding_left=metrics.padding_small,
-        sidebar_content_item_padding_right=metrics.padding_small,
-
-        sidebar_content_item_margin_top=metrics.padding_medium,
-        sidebar_content_item_margin_bottom=metrics.padding_medium,
-        sidebar_content_item_margin_left=metrics.padding_medium,
-        sidebar_content_item_margin_right=metrics.padding_medium,
-        
-
-        # OLD TOKENS
-        dock_border_width=metrics.border_width,
-        header_padding=metrics.padding_medium,
-        toolbar_padding=metrics.padding_medium,
-        toolbar_border_width=metrics.border_width,
-        action_row_radius=metrics.radius_small,
-        action_row_padding_y=metrics.padding_extra_small,
-        action_row_padding_x=metrics.padding_small,
-        input_border_width=metrics.border_width,
-        input_padding=metrics.padding_small,
+        sidebar_content_item_border_top_width=border_width_zero,
+        sidebar_content_item_border_bottom_width=border_width_zero,
+        sidebar_content_item_border_left_width=border_width_zero,
+        sidebar_content_item_border_right_width=border_width_zero,
+
+        sidebar_content_item_x_spacing=padding_small,
+
+        sidebar_content_item_padding_top=padding_small,
+        sidebar_content_item_padding_bottom=padding_small,
+        sidebar_content_item_padding_left=padding_small,
+        sidebar_content_item_padding_right=padding_small,
+
+        sidebar_content_item_margin_top=padding_medium,
+        sidebar_content_item_margin_bottom=padding_medium,
+        sidebar_content_item_margin_left=padding_medium,
+        sidebar_content_item_margin_right=padding_medium,
     )
 
 
@@ -1,19 +1,18 @@
 """Status bar spacing and border tokens derived from Metrics."""
 
-from __future__ import annotations
-
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple
 
 from ..metrics import Metrics
 
 
-@dataclass(frozen=True)
-class StatusBarTokens:
+class StatusBarTokens(NamedTuple):
     border_width: int
     padding_horizontal: int
     min_height: int
 
 
+@lru_cache(maxsize=4)
 def statusbar_tokens(metrics: Metrics) -> StatusBarTokens:
     return StatusBarTokens(
         border_width=metrics.border_width,
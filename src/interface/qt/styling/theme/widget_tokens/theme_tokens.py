@@ -0,0 +1,48 @@
+"""Bundle of every widget token set derived from one Metrics instance."""
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+from ..metrics import Metrics
+from .button_tokens import ButtonTokens, button_tokens
+from .cell_container_tokens import CellContainerTokens, cell_container_tokens
+from .cell_gutter_tokens import CellGutterTokens, cell_gutter_tokens
+from .cell_list_tokens import CellListTokens, cell_list_tokens
+from .cell_row_tokens import CellRowTokens, cell_row_tokens
+from .main_menubar_tokens import MenuBarTokens, menubar_tokens
+from .main_toolbar_tokens import MainToolbarTokens, main_toolbar_tokens
+from .sidebar_tokens import SidebarTokens, sidebar_tokens
+from .statusbar_tokens import StatusBarTokens, statusbar_tokens
+
+
+@dataclass(slots=True)
+class ThemeTokens:
+    buttons: ButtonTokens
+    cell_container: CellContainerTokens
+    cell_gutter: CellGutterTokens
+    cell_list: CellListTokens
+    cell_row: CellRowTokens
+    menubar: MenuBarTokens
+    main_toolbar: MainToolbarTokens
+    sidebar: SidebarTokens
+    statusbar: StatusBarTokens
+
+
+@lru_cache(maxsize=4)
+def theme_tokens(metrics: Metrics) -> ThemeTokens:
+    """Build all widget token sets for ``metrics`` in one pass."""
+
+    return ThemeTokens(
+        buttons=button_tokens(metrics),
+        cell_container=cell_container_tokens(metrics),
+        cell_gutter=cell_gutter_tokens(metrics),
+        cell_list=cell_list_tokens(metrics),
+        cell_row=cell_row_tokens(metrics),
+        menubar=menubar_tokens(metrics),
+        main_toolbar=main_toolbar_tokens(metrics),
+        sidebar=sidebar_tokens(metrics),
+        statusbar=statusbar_tokens(metrics),
+    )
+
+
+__all__ = ["ThemeTokens", "theme_tokens"]
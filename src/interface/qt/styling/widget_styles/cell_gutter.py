@@ -2,13 +2,60 @@
 
 from __future__ import annotations
 
-from textwrap import dedent
+from functools import lru_cache
 
-from interface.qt.styling.theme import Theme, ThemeMode, cell_gutter_tokens, get_theme
+from interface.qt.styling.qss_helpers import border_css
+from interface.qt.styling.theme import Theme, ThemeMode, get_theme
 
 GUTTER_SELECTOR = 'QWidget[cellType="gutter"]'
 GUTTER_LABEL_SELECTOR = 'QLabel[cellRole="line-number"]'
 
+# Per-side token tuples are indexed (left, top, right, bottom).
+_GUTTER_TMPL = """\
+{gutter} {{
+    background-color: {bg.cell_gutter_bg};
+    {gutter_border}
+    border-radius: {metrics.radius_zero}px;
+    padding-top: {tokens.paint_padding[1]}px;
+    padding-right: {tokens.paint_padding[2]}px;
+    padding-bottom: {tokens.paint_padding[3]}px;
+    padding-left: {tokens.paint_padding[0]}px;
+    margin: 0px;
+}}
+/* For focused/selected states */
+/* Add more qss if needed */
+
+{gutter}[state="focused"],
+{gutter}[state="selected"] {{
+    background-color: {bg.selected_gutter_bg};
+}}
+
+{gutter}:hover,
+{gutter}[state="focused"]:hover,
+{gutter}[state="selected"]:hover {{
+    background-color: {bg.hover_bg};
+}}"""
+
+# The index number 
+_LABELS_TMPL = """\
+{gutter} > {label} {{
+    background-color: transparent;
+    color: {text.secondary};
+    min-width: {tokens.label_min_width}px;
+    qproperty-alignment: 'AlignRight | AlignVCenter';
+    font-family: {metrics.font_family};
+    font-size: {metrics.font_size_small}pt;
+}}
+
+/* Labels inherit background from parent gutter */"""
+
+_GUTTER_QSS_TMPL = "\n\n".join(
+    [
+        _GUTTER_TMPL,
+        _LABELS_TMPL,
+    ]
+)
+
 
 def get_qss(
     mode: ThemeMode = ThemeMode.DARK,
@@ -21,61 +68,21 @@ def get_qss(
     and typography.
     """
 
-    theme = theme or get_theme(mode)
-    metrics = theme.metrics
-    tokens = cell_gutter_tokens(metrics)
-    bg = theme.bg
-    border = theme.border
-    text = theme.text
-
-    gutter = dedent(
-        f"""
-        {GUTTER_SELECTOR} {{
-            background-color: {bg.cell_gutter_bg};
-            border-top: {tokens.border_width_top}px solid {border.subtle};
-            border-bottom: {tokens.border_width_bottom}px solid {border.subtle};
-            border-left: {tokens.border_width_left}px solid {border.subtle};
-            border-right: {tokens.border_width_right}px solid {border.subtle};
-            border-radius: {metrics.radius_zero}px;
-            padding-top: {tokens.paint_padding_top}px;
-            padding-right: {tokens.paint_padding_right}px;
-            padding-bottom: {tokens.paint_padding_bottom}px;
-            padding-left: {tokens.paint_padding_left}px;
-            margin: 0px;
-        }}
-        /* For focused/selected states */
-        /* Add more qss if needed */
-
-        {GUTTER_SELECTOR}[state="focused"],
-        {GUTTER_SELECTOR}[state="selected"] {{
-            background-color: {bg.selected_gutter_bg};
-        }}
-
-        {GUTTER_SELECTOR}:hover,
-        {GUTTER_SELECTOR}[state="focused"]:hover,
-        {GUTTER_SELECTOR}[state="selected"]:hover {{
-            background-color: {bg.hover_bg};
-        }}
-        """
-    ).strip()
-     
-    # The index number 
-    labels = dedent(
-        f"""
-        {GUTTER_SELECTOR} > {GUTTER_LABEL_SELECTOR} {{
-            background-color: transparent;
-            color: {text.secondary};
-            min-width: {tokens.label_min_width}px;
-            qproperty-alignment: 'AlignRight | AlignVCenter';
-            font-family: {metrics.font_family};
-            font-size: {metrics.font_size_small}pt;
-        }}
-
-        /* Labels inherit background from parent gutter */
-        """
-    ).strip()
-
-    return f"{gutter}\n\n{labels}"
+    return _build_qss(theme or get_theme(mode))
+
+
+@lru_cache(maxsize=4)
+def _build_qss(theme: Theme) -> str:
+    tokens = theme.tokens.cell_gutter
+    return _GUTTER_QSS_TMPL.format(
+        gutter=GUTTER_SELECTOR,
+        label=GUTTER_LABEL_SELECTOR,
+        metrics=theme.metrics,
+        tokens=tokens,
+        bg=theme.bg,
+        gutter_border=border_css(tokens.border_widths, theme.border.subtle),
+        text=theme.text,
+    )
 
 
 __all__ = ["get_qss"]
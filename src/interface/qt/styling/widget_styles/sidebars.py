@@ -2,9 +2,172 @@
 
 from __future__ import annotations
 
-from textwrap import dedent
-
-from interface.qt.styling.theme import Theme, ThemeMode, get_theme, sidebar_tokens
+from functools import lru_cache
+
+from interface.qt.styling.qss_helpers import border_css
+from interface.qt.styling.theme import Theme, ThemeMode, get_theme
+
+
+# =========================================================================
+# DOCK (SIDEBAR CONTAINER) WIDGET TITLE BAR
+# QDockWidget QSS can only style the title bar, NOT the content widget
+# =========================================================================
+_TITLE_TMPL = """\
+/* Dock widget title bar styling (header area) */
+QDockWidget[dockRole="sidebar"]::title {{
+    background-color: {bg.sidebar_header_bg};
+    color: {text.primary};
+    text-align: left;
+    padding-top: {spacing.sidebar_header_padding_top}px;
+    padding-bottom: {spacing.sidebar_header_padding_bottom}px;
+    padding-left: {spacing.sidebar_header_padding_left}px;
+    padding-right: {spacing.sidebar_header_padding_right}px;
+    {header_border}
+}}"""
+
+# =========================================================================
+# MAIN SIDEBAR PANEL CONTAINER
+# Style the top-level widget that QDockWidget.setWidget() receives
+# =========================================================================
+_PANEL_TMPL = """\
+/* Main sidebar panel containers */
+QWidget#NotebookSidebarPanel,
+QWidget#SettingsSidebarPanel,
+QWidget#TocSidebarPanel {{
+    background-color: {bg.sidebar_bg};
+    border-radius: {spacing.sidebar_container_border_radius}px;
+    {container_border}
+}}"""
+
+# =========================================================================
+# SIDEBAR SECTIONS (Toolbar and Content areas)
+# Target widgets by their sidebarRole property
+# =========================================================================
+_SECTIONS_TMPL = """\
+/* Toolbar section at top of sidebar */
+QWidget[sidebarRole="toolbar"] {{
+    background-color: {bg.sidebar_toolbar_bg};
+    border-radius: {spacing.sidebar_toolbar_border_radius}px;
+    {toolbar_border}
+    padding-top: {spacing.sidebar_toolbar_padding_top}px;
+    padding-bottom: {spacing.sidebar_toolbar_padding_bottom}px;
+    padding-left: {spacing.sidebar_toolbar_padding_left}px;
+    padding-right: {spacing.sidebar_toolbar_padding_right}px;
+    margin-top: {spacing.sidebar_toolbar_margin_top}px;
+    margin-bottom: {spacing.sidebar_toolbar_margin_bottom}px;
+    margin-left: {spacing.sidebar_toolbar_margin_left}px;
+    margin-right: {spacing.sidebar_toolbar_margin_right}px;
+    min-height: {metrics.min_sidebar_toolbar_height}px;
+}}
+
+/* Content section below toolbar */
+QWidget[sidebarRole="content"] {{
+      background-color: {bg.sidebar_content_bg};
+    border-radius: {spacing.sidebar_content_border_radius}px;
+    {content_border}
+    margin-top: {spacing.sidebar_content_margin_top}px;
+    margin-bottom: {spacing.sidebar_content_margin_bottom}px;
+    margin-left: {spacing.sidebar_content_margin_left}px;
+    margin-right: {spacing.sidebar_content_margin_right}px;
+}}"""
+
+# =========================================================================
+# CHILD WIDGETS (Lists, Inputs, Labels)
+# Style specific widget types within sidebars
+# =========================================================================
+_CHILD_WIDGETS_TMPL = """\
+/* List widgets */
+QDockWidget[dockRole="sidebar"] QListView {{
+    background-color: transparent;
+    border: none;
+    color: {text.primary};
+}}
+
+QDockWidget[dockRole="sidebar"] QListView::item {{
+    background-color: transparent;
+    color: {text.primary};
+    padding: 6px 8px;
+    border-radius: 4px;
+}}
+
+QDockWidget[dockRole="sidebar"] QListView::item:selected {{
+    background-color: {buttons.pressed};
+    color: {buttons.text};
+}}
+
+QDockWidget[dockRole="sidebar"] QListView::item:hover {{
+    background-color: {buttons.hover};
+    color: {buttons.text};
+}}
+
+/* Input widgets (ComboBox, SpinBox) */
+QDockWidget[dockRole="sidebar"] QComboBox,
+QDockWidget[dockRole="sidebar"] QSpinBox {{
+    background-color: {bg.sidebar_content_bg};
+    border: {metrics.border_width}px solid {buttons.border};
+    padding: {metrics.padding_small}px;
+    border-radius: 2px;
+}}
+
+QDockWidget[dockRole="sidebar"] QComboBox:hover,
+QDockWidget[dockRole="sidebar"] QSpinBox:hover {{
+    border-color: {buttons.focus};
+}}
+
+/* SpinBox buttons */
+QDockWidget[dockRole="sidebar"] QSpinBox::up-button,
+QDockWidget[dockRole="sidebar"] QSpinBox::down-button {{
+    background-color: {buttons.normal};
+    border: 1px solid {buttons.border};
+    width: 16px;
+    border-radius: 2px;
+}}
+
+QDockWidget[dockRole="sidebar"] QSpinBox::up-button:hover,
+QDockWidget[dockRole="sidebar"] QSpinBox::down-button:hover {{
+    background-color: {buttons.hover};
+    border-color: {buttons.focus};
+}}
+
+QDockWidget[dockRole="sidebar"] QSpinBox::up-button:pressed,
+QDockWidget[dockRole="sidebar"] QSpinBox::down-button:pressed {{
+    background-color: {buttons.pressed};
+    border-color: {buttons.focus};
+}}
+
+/* SpinBox arrows */
+QDockWidget[dockRole="sidebar"] QSpinBox::up-arrow {{
+    width: 0;
+    height: 0;
+    border-left: 3px solid transparent;
+    border-right: 3px solid transparent;
+    border-bottom: 4px solid {buttons.text};
+    margin: 0px;
+}}
+
+QDockWidget[dockRole="sidebar"] QSpinBox::down-arrow {{
+    width: 0;
+    height: 0;
+    border-left: 3px solid transparent;
+    border-right: 3px solid transparent;
+    border-top: 4px solid {buttons.text};
+    margin: 0px;
+}}
+
+/* Labels */
+QDockWidget[dockRole="sidebar"] QLabel {{
+    background-color: transparent;
+    color: {text.primary};
+}}"""
+
+_SIDEBAR_QSS_TMPL = "\n\n".join(
+    [
+        _TITLE_TMPL,
+        _PANEL_TMPL,
+        _SECTIONS_TMPL,
+        _CHILD_WIDGETS_TMPL,
+    ]
+)
 
 
 def get_qss(
@@ -13,227 +176,24 @@ def get_qss(
 ) -> str:
     """Return QSS that styles all dock-based sidebars consistently."""
 
-    theme = theme or get_theme(mode)
-    metrics = theme.metrics
-    spacing = sidebar_tokens(metrics)  # sidebar_tokens = get_sidebar_tokens(metrics)We
-    bg = theme.bg
-    border = theme.border
-    buttons = theme.buttons.sidebar_toolbar
-    text = theme.text
-
-    # =========================================================================
-    # DOCK (SIDEBAR CONTAINER) WIDGET TITLE BAR
-    # QDockWidget QSS can only style the title bar, NOT the content widget
-    # =========================================================================
-    title_block = dedent(
-        f"""
-        /* Dock widget title bar styling (header area) */
-        QDockWidget#NotebooksDock::title,
-        QDockWidget#SettingsDock::title,
-        QDockWidget#TocDock::title {{
-            background-color: {bg.sidebar_header_bg};
-            color: {text.primary};
-            text-align: left;
-            padding-top: {spacing.sidebar_header_padding_top}px;
-            padding-bottom: {spacing.sidebar_header_padding_bottom}px;
-            padding-left: {spacing.sidebar_header_padding_left}px;
-            padding-right: {spacing.sidebar_header_padding_right}px;
-            border-top: {spacing.sidebar_header_border_top_width}px solid {border.subtle};
-            border-bottom: {spacing.sidebar_header_border_bottom_width}px solid {border.subtle};
-            border-left: {spacing.sidebar_header_border_left_width}px solid {border.subtle};
-            border-right: {spacing.sidebar_header_border_right_width}px solid {border.subtle};
-        }}
-        """
-    ).strip()
-
-    # =========================================================================
-    # MAIN SIDEBAR PANEL CONTAINER
-    # Style the top-level widget that QDockWidget.setWidget() receives
-    # =========================================================================
-    panel_block = dedent(
-        f"""
-        /* Main sidebar panel containers */
-        QWidget#NotebookSidebarPanel,
-        QWidget#SettingsSidebarPanel,
-        QWidget#TocSidebarPanel {{
-            background-color: {bg.sidebar_bg};
-            border-radius: {spacing.sidebar_container_border_radius}px;
-            border-top: {spacing.sidebar_container_border_width_top}px solid {border.subtle};
-            border-bottom: {spacing.sidebar_container_border_width_bottom}px solid {border.subtle};
-            border-left: {spacing.sidebar_container_border_width_left}px solid {border.subtle};
-            border-right: {spacing.sidebar_container_border_width_right}px solid {border.subtle};
-        }}
-        """
-    ).strip()
-
-    # =========================================================================
-    # SIDEBAR SECTIONS (Toolbar and Content areas)
-    # Target widgets by their sidebarRole property
-    # =========================================================================
-    sections_block = dedent(
-        f"""
-        /* Toolbar section at top of sidebar */
-        QWidget[sidebarRole="toolbar"] {{
-            background-color: {bg.sidebar_toolbar_bg};
-            border-radius: {spacing.sidebar_toolbar_border_radius}px;
-            border-top: {spacing.sidebar_toolbar_border_top_width}px solid {border.subtle};
-            border-bottom: {spacing.sidebar_toolbar_border_bottom_width}px solid {border.subtle};
-            border-left: {spacing.sidebar_toolbar_border_left_width}px solid {border.subtle};
-            border-right: {spacing.sidebar_toolbar_border_right_width}px solid {border.subtle};
-            padding-top: {spacing.sidebar_toolbar_padding_top}px;
-            padding-bottom: {spacing.sidebar_toolbar_padding_bottom}px;
-            padding-left: {spacing.sidebar_toolbar_padding_left}px;
-            padding-right: {spacing.sidebar_toolbar_padding_right}px;
-            margin-top: {spacing.sidebar_toolbar_margin_top}px;
-            margin-bottom: {spacing.sidebar_toolbar_margin_bottom}px;
-            margin-left: {spacing.sidebar_toolbar_margin_left}px;
-            margin-right: {spacing.sidebar_toolbar_margin_right}px;
-            min-height: {metrics.min_sidebar_toolbar_height}px;
-        }}
-
-        /* Content section below toolbar */
-        QWidget[sidebarRole="content"] {{
-              background-color: {bg.sidebar_content_bg};
-            border-radius: {spacing.sidebar_content_border_radius}px;
-            border-top: {spacing.sidebar_content_border_top_width}px solid {border.subtle};
-            border-bottom: {spacing.sidebar_content_border_bottom_width}px solid {border.subtle};
-            border-left: {spacing.sidebar_content_border_left_width}px solid {border.subtle};
-            border-right: {spacing.sidebar_content_border_right_width}px solid {border.subtle};
-            margin-top: {spacing.sidebar_content_margin_top}px;
-            margin-bottom: {spacing.sidebar_content_margin_bottom}px;
-            margin-left: {spacing.sidebar_content_margin_left}px;
-            margin-right: {spacing.sidebar_content_margin_right}px;
-        }}
-        """
-    ).strip()
-
-    # =========================================================================
-    # CHILD WIDGETS (Lists, Inputs, Labels)
-    # Style specific widget types within sidebars
-    # =========================================================================
-    child_widgets_block = dedent(
-        f"""
-        /* List widgets */
-        QDockWidget#NotebooksDock QListWidget,
-        QDockWidget#SettingsDock QListWidget,
-        QDockWidget#TocDock QListWidget {{
-            background-color: transparent;
-            border: none;
-            color: {text.primary};
-        }}
-
-        QDockWidget#NotebooksDock QListWidget::item,
-        QDockWidget#SettingsDock QListWidget::item,
-        QDockWidget#TocDock QListWidget::item {{
-            background-color: transparent;
-            color: {text.primary};
-            padding: 6px 8px;
-            border-radius: 4px;
-        }}
-
-        QDockWidget#NotebooksDock QListWidget::item:selected,
-        QDockWidget#SettingsDock QListWidget::item:selected,
-        QDockWidget#TocDock QListWidget::item:selected {{
-            background-color: {buttons.pressed};
-            color: {buttons.text};
-        }}
-        
-        QDockWidget#NotebooksDock QListWidget::item:hover,
-        QDockWidget#SettingsDock QListWidget::item:hover,
-        QDockWidget#TocDock QListWidget::item:hover {{
-            background-color: {buttons.hover};
-            color: {buttons.text};
-        }}
-
-        /* Input widgets (ComboBox, SpinBox) */
-        QDockWidget#NotebooksDock QComboBox,
-        QDockWidget#SettingsDock QComboBox,
-        QDockWidget#TocDock QComboBox,
-        QDockWidget#NotebooksDock QSpinBox,
-        QDockWidget#SettingsDock QSpinBox,
-        QDockWidget#TocDock QSpinBox {{
-            background-color: {bg.sidebar_content_bg};
-            border: {spacing.input_border_width}px solid {buttons.border};
-            padding: {spacing.input_padding}px;
-            border-radius: 2px;
-        }}
-
-        QDockWidget#NotebooksDock QComboBox:hover,
-        QDockWidget#SettingsDock QComboBox:hover,
-        QDockWidget#TocDock QComboBox:hover,
-        QDockWidget#NotebooksDock QSpinBox:hover,
-        QDockWidget#SettingsDock QSpinBox:hover,
-        QDockWidget#TocDock QSpinBox:hover {{
-            border-color: {buttons.focus};
-        }}
-
-        /* SpinBox buttons */
-        QDockWidget#NotebooksDock QSpinBox::up-button,
-        QDockWidget#SettingsDock QSpinBox::up-button,
-        QDockWidget#TocDock QSpinBox::up-button,
-        QDockWidget#NotebooksDock QSpinBox::down-button,
-        QDockWidget#SettingsDock QSpinBox::down-button,
-        QDockWidget#TocDock QSpinBox::down-button {{
-            background-color: {buttons.normal};
-            border: 1px solid {buttons.border};
-            width: 16px;
-            border-radius: 2px;
-        }}
-
-        QDockWidget#NotebooksDock QSpinBox::up-button:hover,
-        QDockWidget#SettingsDock QSpinBox::up-button:hover,
-        QDockWidget#TocDock QSpinBox::up-button:hover,
-        QDockWidget#NotebooksDock QSpinBox::down-button:hover,
-        QDockWidget#SettingsDock QSpinBox::down-button:hover,
-        QDockWidget#TocDock QSpinBox::down-button:hover {{
-            background-color: {buttons.hover};
-            border-color: {buttons.focus};
-        }}
-
-        QDockWidget#NotebooksDock QSpinBox::up-button:pressed,
-        QDockWidget#SettingsDock QSpinBox::up-button:pressed,
-        QDockWidget#TocDock QSpinBox::up-button:pressed,
-        QDockWidget#NotebooksDock QSpinBox::down-button:pressed,
-        QDockWidget#SettingsDock QSpinBox::down-button:pressed,
-        QDockWidget#TocDock QSpinBox::down-button:pressed {{
-            background-color: {buttons.pressed};
-            border-color: {buttons.focus};
-        }}
-
-        /* SpinBox arrows */
-        QDockWidget#NotebooksDock QSpinBox::up-arrow,
-        QDockWidget#SettingsDock QSpinBox::up-arrow,
-        QDockWidget#TocDock QSpinBox::up-arrow {{
-            width: 0;
-            height: 0;
-            border-left: 3px solid transparent;
-            border-right: 3px solid transparent;
-            border-bottom: 4px solid {buttons.text};
-            margin: 0px;
-        }}
-
-        QDockWidget#NotebooksDock QSpinBox::down-arrow,
-        QDockWidget#SettingsDock QSpinBox::down-arrow,
-        QDockWidget#TocDock QSpinBox::down-arrow {{
-            width: 0;
-            height: 0;
-            border-left: 3px solid transparent;
-            border-right: 3px solid transparent;
-            border-top: 4px solid {buttons.text};
-            margin: 0px;
-        }}
-
-        /* Labels */
-        QDockWidget#NotebooksDock QLabel,
-        QDockWidget#SettingsDock QLabel,
-        QDockWidget#TocDock QLabel {{
-            background-color: transparent;
-            color: {text.primary};
-        }}
-        """
-    ).strip()
-
-    return f"{title_block}\n\n{panel_block}\n\n{sections_block}\n\n{child_widgets_block}"
+    return _build_qss(theme or get_theme(mode))
+
+
+@lru_cache(maxsize=4)
+def _build_qss(theme: Theme) -> str:
+    spacing = theme.tokens.sidebar
+    subtle = theme.border.subtle
+    return _SIDEBAR_QSS_TMPL.format(
+        metrics=theme.metrics,
+        spacing=spacing,
+        bg=theme.bg,
+        header_border=border_css(spacing.header_border_widths, subtle),
+        container_border=border_css(spacing.container_border_widths, subtle),
+        toolbar_border=border_css(spacing.toolbar_border_widths, subtle),
+        content_border=border_css(spacing.content_border_widths, subtle),
+        buttons=theme.buttons.sidebar_toolbar,
+        text=theme.text,
+    )
 
 
 __all__ = ["get_qss"]
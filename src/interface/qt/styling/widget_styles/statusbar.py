@@ -2,12 +2,33 @@
 
 from __future__ import annotations
 
-from textwrap import dedent
+from functools import lru_cache
 
-from interface.qt.styling.theme import Theme, ThemeMode, get_theme, statusbar_tokens
+from interface.qt.styling.theme import Theme, ThemeMode, get_theme
 
 STATUSBAR_SELECTOR = 'QStatusBar#MainStatusBar'
 
+_STATUSBAR_QSS_TMPL = """\
+{selector} {{
+    background-color: {palette.background};
+    color: {palette.text};
+    border-top: {spacing.border_width}px solid {palette.border_top};
+    padding: 0 {spacing.padding_horizontal}px;
+    min-height: {spacing.min_height}px;
+    font-family: {metrics.font_family};
+    font-size: {metrics.font_size_small}pt;
+}}
+
+{selector} QLabel {{
+    background-color: {palette.background};
+    color: {palette.text};
+}}
+
+{selector} QLabel[statusRole="warning"] {{
+    color: {palette.warning};
+    font-weight: 600;
+}}"""
+
 
 def get_qss(
     mode: ThemeMode = ThemeMode.DARK,
@@ -15,36 +36,17 @@ def get_qss(
 ) -> str:
     """Return QSS for the status bar including message labels."""
 
-    theme = theme or get_theme(mode)
-    metrics = theme.metrics
-    spacing = statusbar_tokens(metrics)
-    palette = theme.statusbar
-
-    base = dedent(
-        f"""
-        {STATUSBAR_SELECTOR} {{
-            background-color: {palette.background};
-            color: {palette.text};
-            border-top: {spacing.border_width}px solid {palette.border_top};
-            padding: 0 {spacing.padding_horizontal}px;
-            min-height: {spacing.min_height}px;
-            font-family: {metrics.font_family};
-            font-size: {metrics.font_size_small}pt;
-        }}
-
-        {STATUSBAR_SELECTOR} QLabel {{
-            background-color: {palette.background};
-            color: {palette.text};
-        }}
-
-        {STATUSBAR_SELECTOR} QLabel[statusRole="warning"] {{
-            color: {palette.warning};
-            font-weight: 600;
-        }}
-        """
-    ).strip()
-
-    return base
+    return _build_qss(theme or get_theme(mode))
+
+
+@lru_cache(maxsize=4)
+def _build_qss(theme: Theme) -> str:
+    return _STATUSBAR_QSS_TMPL.format(
+        selector=STATUSBAR_SELECTOR,
+        metrics=theme.metrics,
+        spacing=theme.tokens.statusbar,
+        palette=theme.statusbar,
+    )
 
 
 __all__ = ["get_qss"]
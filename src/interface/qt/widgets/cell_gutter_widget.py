@@ -28,12 +28,7 @@ class CellGutterWidget(QWidget):
         layout = QVBoxLayout(self)
         # Layout geometry insets stay in QWidget code because Qt stylesheets
         # cannot adjust QLayout margins—tokens keep them theme-aware.
-        layout.setContentsMargins(
-            tokens.layout_inset_left,
-            tokens.layout_inset_top,
-            tokens.layout_inset_right,
-            tokens.layout_inset_bottom,
-        )
+        layout.setContentsMargins(*tokens.layout_inset)
         layout.setSpacing(0) # Has no effect. 
 
         self._label = QLabel(self._format_index(index), self)
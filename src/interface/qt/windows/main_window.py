@@ -104,11 +104,8 @@ class CellRow(QFrame):
         row_layout.setSpacing(row_tokens.gutter_gap)
 
         self._gutter = CellGutterWidget(index=index, tokens=gutter_tokens)
-        gutter_width = (
-            gutter_tokens.label_min_width
-            + gutter_tokens.layout_inset_left
-            + gutter_tokens.layout_inset_right
-        )
+        inset_left, _, inset_right, _ = gutter_tokens.layout_inset
+        gutter_width = gutter_tokens.label_min_width + inset_left + inset_right
         self._gutter.setFixedWidth(gutter_width)
         self._gutter.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
 
@@ -350,7 +347,7 @@ class LunaQtWindow(QMainWindow):
         self._style_preferences = base_preferences
         self._theme_group = QActionGroup(self)
         self._theme_group.setExclusive(True)
-        self._theme_actions: dict[str, Any] = {}
+        self._theme_actions: dict[ThemeMode, Any] = {}
         self._cell_rows: list[CellRow] = []
         self._cell_list_widget: CellListWidget | None = None
         self._cell_list_layout: QVBoxLayout | None = None
@@ -488,9 +485,9 @@ class LunaQtWindow(QMainWindow):
             action.triggered.connect(lambda checked, m=mode_value: self._switch_theme(m) if checked else None)
             view_menu.addAction(action)
             self._theme_group.addAction(action)
-            self._theme_actions[mode_value.value] = action
+            self._theme_actions[mode_value] = action
 
-        self._theme_actions[self._mode.value].setChecked(True)
+        self._theme_actions[self._mode].setChecked(True)
 
         self._install_cell_action_buttons(menu_bar)
         self._install_sidebar_corner_buttons(menu_bar)
@@ -649,7 +646,7 @@ class LunaQtWindow(QMainWindow):
         
         self._clear_cell_rows()
 
-        cells = list(state.iter_cells())
+        cells = state.ordered_cells()
         if not cells:
             self._app_state.selected_cell_id = None
             state.active_cell_id = None
@@ -685,7 +682,7 @@ class LunaQtWindow(QMainWindow):
                 cell_type=cell.cell_type,
                 run_callback=self._on_run_code,
                 content_changed_callback=self._on_cell_content_changed,
-                is_dark_mode=(self._mode == ThemeMode.DARK),
+                is_dark_mode=(self._mode is ThemeMode.DARK),
             )
             
             # Set execution count for code cells
@@ -801,7 +798,7 @@ class LunaQtWindow(QMainWindow):
         can_move_down = False
 
         if state and cell_id and cell_id in state.notebook.cell_ids:
-            order = list(state.notebook.cell_ids)
+            order = state.cell_order()
             index = order.index(cell_id)
             can_move_up = index > 0
             can_move_down = index < len(order) - 1
@@ -847,7 +844,7 @@ class LunaQtWindow(QMainWindow):
         if not cell_id or cell_id not in state.notebook.cell_ids:
             return
 
-        order = list(state.notebook.cell_ids)
+        order = state.cell_order()
         index = order.index(cell_id)
         new_index = index + step
 
@@ -873,7 +870,7 @@ class LunaQtWindow(QMainWindow):
         if not state or cell_id not in state.notebook.cell_ids:
             return
 
-        order = list(state.notebook.cell_ids)
+        order = state.cell_order()
         index = order.index(cell_id)
 
         next_selection: str | None = None
@@ -970,7 +967,7 @@ class LunaQtWindow(QMainWindow):
         self._execution_manager.cell_failed.connect(self._on_cell_execution_failed)
         
         # Set initial matplotlib style based on theme
-        is_dark = self._mode == ThemeMode.DARK
+        is_dark = self._mode is ThemeMode.DARK
         self._execution_manager.set_plot_style(get_matplotlib_style(is_dark))
         
         self._connect_notebook_events()
@@ -997,7 +994,7 @@ class LunaQtWindow(QMainWindow):
         toolbar.rename_notebook_requested.connect(self._handle_notebook_rename_requested)
         toolbar.delete_notebook_requested.connect(self._handle_notebook_delete_requested)
 
-        existing = self._notebook_manager.list_notebooks()
+        existing = self._notebook_manager.list_notebook_headers()
         toolbar.set_notebooks([(nb.notebook_id, nb.title) for nb in existing])
         if existing:
             first_id = existing[0].notebook_id
@@ -1009,6 +1006,8 @@ class LunaQtWindow(QMainWindow):
     def _create_sidebar_dock(self, object_name: str, title: str) -> QDockWidget:
         dock = QDockWidget(title, self)
         dock.setObjectName(object_name)
+        # Sidebar QSS matches docks by this role instead of by object name.
+        dock.setProperty("dockRole", "sidebar")
         dock.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
         dock.setFeatures(QDockWidget.DockWidgetFeature.NoDockWidgetFeatures)
         # Hide the title bar by setting it to an empty widget
@@ -1040,41 +1039,13 @@ class LunaQtWindow(QMainWindow):
         """Move the selected notebook up in the sidebar list."""
         if not self._notebooks_toolbar:
             return
-        
-        # Get current selection
-        current_row = self._notebooks_toolbar._list.currentRow()
-        if current_row <= 0:
-            return  # Already at top or no selection
-        
-        # Get the item data
-        item = self._notebooks_toolbar._list.takeItem(current_row)
-        
-        # Reinsert at previous position
-        self._notebooks_toolbar._list.insertItem(current_row - 1, item)
-        self._notebooks_toolbar._list.setCurrentRow(current_row - 1)
-        
-        # Update button states
-        self._notebooks_toolbar._update_move_buttons()
+        self._notebooks_toolbar.move_current_notebook(-1)
 
     def _handle_move_notebook_down_clicked(self) -> None:
         """Move the selected notebook down in the sidebar list."""
         if not self._notebooks_toolbar:
             return
-        
-        # Get current selection
-        current_row = self._notebooks_toolbar._list.currentRow()
-        if current_row < 0 or current_row >= self._notebooks_toolbar._list.count() - 1:
-            return  # Already at bottom or no selection
-        
-        # Get the item data
-        item = self._notebooks_toolbar._list.takeItem(current_row)
-        
-        # Reinsert at next position
-        self._notebooks_toolbar._list.insertItem(current_row + 1, item)
-        self._notebooks_toolbar._list.setCurrentRow(current_row + 1)
-        
-        # Update button states
-        self._notebooks_toolbar._update_move_buttons()
+        self._notebooks_toolbar.move_current_notebook(1)
 
     def _handle_notebook_selected(self, notebook_id: str) -> None:
         if not self._notebook_manager:
@@ -1167,7 +1138,7 @@ class LunaQtWindow(QMainWindow):
         if not self._notebook_manager:
             return "Untitled Notebook"
 
-        existing_titles = {nb.title for nb in self._notebook_manager.list_notebooks()}
+        existing_titles = {nb.title for nb in self._notebook_manager.list_notebook_headers()}
         base = "Untitled Notebook"
         if base not in existing_titles:
             return base
@@ -1234,12 +1205,12 @@ class LunaQtWindow(QMainWindow):
         
         # Update matplotlib style for execution manager
         if self._execution_manager:
-            is_dark = self._mode == ThemeMode.DARK
+            is_dark = self._mode is ThemeMode.DARK
             self._execution_manager.set_plot_style(get_matplotlib_style(is_dark))
         
         # Update matplotlib style for execution manager
         if self._execution_manager:
-            is_dark = self._mode == ThemeMode.DARK
+            is_dark = self._mode is ThemeMode.DARK
             self._execution_manager.set_plot_style(get_matplotlib_style(is_dark))
 
     def _handle_cell_selected(self, row: CellRow) -> None:
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 
+
+@lru_cache(maxsize=256)
 def hex_to_rgba(hex_color: str, alpha: float) -> str:
     """Return an rgba() string for the given hex color and alpha."""
 
@@ -99,6 +99,35 @@ class TestDataStore(_BaseCoreTestCase):
         listed = sorted(self.store.list_notebooks(), key=lambda item: item["notebook_id"])
         self.assertEqual([item["title"] for item in listed], ["Alpha", "Beta"])
 
+    def test_cached_notebook_payload_is_isolated(self) -> None:
+        self.store.save_notebook({"notebook_id": "nb-1", "title": "Demo", "cell_ids": ["a"]})
+        first = self.store.load_notebook("nb-1")
+        assert first is not None
+        first["cell_ids"].append("mutated")
+
+        second = self.store.load_notebook("nb-1")
+        assert second is not None
+        self.assertEqual(second["cell_ids"], ["a"])
+
+    def test_notebook_ops_replay_on_load(self) -> None:
+        self.store.save_notebook({"notebook_id": "nb-1", "title": "Demo", "cell_ids": ["a"]})
+        self.store.append_notebook_op("nb-1", {"op": "insert", "cell_id": "b", "position": 0})
+        self.store.append_notebook_op("nb-1", {"op": "move", "cell_id": "a", "position": 0})
+        self.store.append_notebook_op(
+            "nb-1",
+            {"op": "remove", "cell_id": "b", "modified_at": "2024-01-01T00:00:00+00:00"},
+        )
+
+        loaded = self.store.load_notebook("nb-1")
+        assert loaded is not None
+        self.assertEqual(loaded["cell_ids"], ["a"])
+        self.assertEqual(loaded["modified_at"], "2024-01-01T00:00:00+00:00")
+
+        # A full save checkpoints the notebook and clears the log.
+        self.store.save_notebook(loaded)
+        log_path = self.store.data_root / "notebooks" / "nb-1.oplog"
+        self.assertFalse(log_path.exists())
+
 
 class TestCellManager(_BaseCoreTestCase):
     def test_create_update_and_delete_cell(self) -> None:
@@ -129,6 +158,22 @@ class TestCellManager(_BaseCoreTestCase):
         self.assertEqual(self.cell_events[-1][0], "created")
 
 
+    def test_cell_outputs_are_shared_read_only(self) -> None:
+        cell = self.cell_manager.create_cell("code")
+        updated = self.cell_manager.update_cell(
+            cell.cell_id, outputs=[{"output_type": "stream", "text": "hi"}]
+        )
+        assert updated is not None
+
+        with self.assertRaises(TypeError):
+            updated.outputs.append({})
+        with self.assertRaises(TypeError):
+            updated.metadata["language"] = "ruby"
+
+        renamed = updated.copy_with(content="print('hi')")
+        self.assertIs(renamed.outputs, updated.outputs)
+
+
 class TestNotebookManager(_BaseCoreTestCase):
     def test_notebook_lifecycle_and_ordering(self) -> None:
         notebook = self.notebook_manager.create_notebook("My Notebook")
@@ -145,14 +190,14 @@ class TestNotebookManager(_BaseCoreTestCase):
         self.notebook_manager.add_cell(notebook.notebook_id, cell_one)
         self.notebook_manager.add_cell(notebook.notebook_id, cell_two, position=0)
         order = self.notebook_manager.get_cell_order(notebook.notebook_id)
-        self.assertEqual(order, [cell_two.cell_id, cell_one.cell_id])
+        self.assertEqual(order, (cell_two.cell_id, cell_one.cell_id))
         self.assertEqual(self.notebook_events[-1][0], "state_updated")
 
         moved = self.notebook_manager.move_cell(notebook.notebook_id, cell_one.cell_id, 0)
         self.assertTrue(moved)
         self.assertEqual(
             self.notebook_manager.get_cell_order(notebook.notebook_id),
-            [cell_one.cell_id, cell_two.cell_id],
+            (cell_one.cell_id, cell_two.cell_id),
         )
         self.assertEqual(self.notebook_events[-2][0], "cell_moved")
 
@@ -163,12 +208,12 @@ class TestNotebookManager(_BaseCoreTestCase):
 
         removed = self.notebook_manager.remove_cell(notebook.notebook_id, cell_two.cell_id)
         self.assertTrue(removed)
-        self.assertEqual(self.notebook_manager.get_cell_order(notebook.notebook_id), [cell_one.cell_id])
+        self.assertEqual(self.notebook_manager.get_cell_order(notebook.notebook_id), (cell_one.cell_id,))
         self.assertEqual(self.notebook_events[-2][0], "cell_removed")
 
         # Cell deletion propagates to the cached state
         self.cell_manager.delete_cell(cell_one.cell_id)
-        self.assertEqual(self.notebook_manager.get_cell_order(notebook.notebook_id), [])
+        self.assertEqual(self.notebook_manager.get_cell_order(notebook.notebook_id), ())
         self.assertEqual(self.notebook_events[-2][0], "cell_removed")
 
         self.assertTrue(self.notebook_manager.delete_notebook(notebook.notebook_id))
@@ -188,6 +233,18 @@ class TestNotebookManager(_BaseCoreTestCase):
         notebooks = self.notebook_manager.list_notebooks()
         self.assertEqual({nb.notebook_id for nb in notebooks}, {notebook.notebook_id, other.notebook_id})
 
+        self.notebook_manager.rename_notebook(other.notebook_id, "Renamed")
+        headers = self.notebook_manager.list_notebook_headers()
+        self.assertEqual(
+            {header.notebook_id: header.title for header in headers},
+            {notebook.notebook_id: "One", other.notebook_id: "Renamed"},
+        )
+
+        self.notebook_manager.delete_notebook(notebook.notebook_id)
+        fresh_store = DataStore(self.store.data_root)
+        headers = NotebookManager(fresh_store, CellManager(fresh_store)).list_notebook_headers()
+        self.assertEqual([header.notebook_id for header in headers], [other.notebook_id])
+
     def test_state_updates_when_cells_change(self) -> None:
         notebook = self.notebook_manager.create_notebook("Notebook")
         cell = self.cell_manager.create_cell("code", content="print('a')")
@@ -202,6 +259,79 @@ class TestNotebookManager(_BaseCoreTestCase):
         assert cached_cell is not None
         self.assertEqual(cached_cell.content, "print('b')")
 
+    def test_save_without_changes_skips_write(self) -> None:
+        notebook = self.notebook_manager.create_notebook("Notebook")
+        self.notebook_events.clear()
+
+        self.assertTrue(self.notebook_manager.save_notebook(notebook.notebook_id))
+        self.assertEqual(self.notebook_events, [])
+
+        cell = self.cell_manager.create_cell("code")
+        self.notebook_manager.add_cell(notebook.notebook_id, cell)
+        self.notebook_events.clear()
+        self.assertTrue(self.notebook_manager.save_notebook(notebook.notebook_id))
+        self.assertEqual([name for name, _ in self.notebook_events], ["state_updated"])
+
+    def test_cells_load_lazily_and_missing_ids_are_pruned(self) -> None:
+        notebook = self.notebook_manager.create_notebook("Notebook")
+        kept = self.cell_manager.create_cell("code", content="keep")
+        dropped = self.cell_manager.create_cell("code", content="drop")
+        self.notebook_manager.add_cell(notebook.notebook_id, kept)
+        self.notebook_manager.add_cell(notebook.notebook_id, dropped)
+        # Tombstone the cell behind the notebook manager's back.
+        CellManager(self.store).delete_cell(dropped.cell_id)
+
+        reloaded = NotebookManager(self.store, CellManager(self.store))
+        state = reloaded.get_state(notebook.notebook_id)
+        assert state is not None
+        self.assertEqual(state.cells, {})
+        self.assertEqual(len(state.cell_order()), 2)
+
+        cell = reloaded.get_cell_lazy(notebook.notebook_id, kept.cell_id)
+        assert cell is not None
+        self.assertEqual(cell.content, "keep")
+        self.assertEqual([c.cell_id for c in state.ordered_cells()], [kept.cell_id])
+
+        reloaded.save_notebook(notebook.notebook_id)
+        self.assertEqual(reloaded.get_cell_order(notebook.notebook_id), (kept.cell_id,))
+
+    def test_deleting_unread_cell_removes_it_from_notebook(self) -> None:
+        notebook = self.notebook_manager.create_notebook("Notebook")
+        kept = self.cell_manager.create_cell("code", content="keep")
+        dropped = self.cell_manager.create_cell("code", content="drop")
+        self.notebook_manager.add_cell(notebook.notebook_id, kept)
+        self.notebook_manager.add_cell(notebook.notebook_id, dropped)
+
+        cell_manager = CellManager(self.store)
+        reloaded = NotebookManager(self.store, cell_manager)
+        events: list[str] = []
+        reloaded.events.cell_removed.connect(lambda *_: events.append("cell_removed"))
+        reloaded.events.state_updated.connect(lambda *_: events.append("state_updated"))
+        state = reloaded.get_state(notebook.notebook_id)
+        assert state is not None
+        self.assertEqual(state.cells, {})
+
+        self.assertTrue(cell_manager.delete_cell(dropped.cell_id))
+        self.assertEqual(events, ["cell_removed", "state_updated"])
+        self.assertEqual(reloaded.get_cell_order(notebook.notebook_id), (kept.cell_id,))
+
+        fresh = NotebookManager(self.store, CellManager(self.store))
+        self.assertEqual(fresh.get_cell_order(notebook.notebook_id), (kept.cell_id,))
+
+    def test_cell_order_survives_reload(self) -> None:
+        notebook = self.notebook_manager.create_notebook("Notebook")
+        cells = [self.cell_manager.create_cell("code", content=str(i)) for i in range(3)]
+        for cell in cells:
+            self.notebook_manager.add_cell(notebook.notebook_id, cell)
+        self.notebook_manager.move_cell(notebook.notebook_id, cells[2].cell_id, 0)
+        self.notebook_manager.remove_cell(notebook.notebook_id, cells[1].cell_id)
+
+        reloaded = NotebookManager(self.store, CellManager(self.store))
+        self.assertEqual(
+            reloaded.get_cell_order(notebook.notebook_id),
+            (cells[2].cell_id, cells[0].cell_id),
+        )
+
 
 
 
@@ -0,0 +1 @@
+"""Tests for the Qt interface layer that run without a display."""
@@ -0,0 +1,67 @@
+"""Tests for the notebook sidebar widget."""
+
+from __future__ import annotations
+
+import os
+import unittest
+from pathlib import Path
+
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication
+
+from interface.qt.sidebars import NotebookSidebarWidget
+from interface.qt.styling.theme import Metrics
+from interface.qt.styling.theme.widget_tokens import button_tokens, sidebar_tokens
+
+
+class HiddenNotebookSidebarTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._app = QApplication.instance() or QApplication([])
+
+    def setUp(self) -> None:
+        metrics = Metrics()
+        self.sidebar = NotebookSidebarWidget(tokens=sidebar_tokens(metrics), button_tokens=button_tokens(metrics))
+        self.selected: list[str] = []
+        self.sidebar.notebook_selected.connect(self.selected.append)
+        self.sidebar.set_notebooks([("a", "A"), ("b", "B"), ("c", "C")])
+
+    def tearDown(self) -> None:
+        self.sidebar.deleteLater()
+
+    def test_select_emits_while_hidden(self) -> None:
+        self.sidebar.select_notebook("b")
+        self.sidebar.select_notebook("b")
+        self.assertEqual(self.selected, ["b"])
+        self.assertEqual(self.sidebar.current_notebook_id(), "b")
+        self.assertFalse(self.sidebar._built)
+
+    def test_deleting_active_notebook_selects_successor(self) -> None:
+        # Mirrors MainWindow._on_notebook_deleted with the sidebar never shown.
+        self.sidebar.select_notebook("a")
+        next_id = self.sidebar.remove_notebook("a")
+        self.assertEqual(next_id, "b")
+        self.sidebar.select_notebook(next_id)
+        self.assertEqual(self.selected, ["a", "b"])
+        self.assertEqual(self.sidebar.current_notebook_id(), "b")
+
+    def test_latest_selection_is_applied_on_show(self) -> None:
+        for notebook_id in ("a", "c", "b"):
+            self.sidebar.select_notebook(notebook_id)
+        self.assertEqual(self.sidebar._pending_select_id, "b")
+
+        self.sidebar.show()
+        self.assertEqual(self.sidebar.current_notebook_id(), "b")
+        self.assertEqual(self.selected, ["a", "c", "b"])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
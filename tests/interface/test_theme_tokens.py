@@ -0,0 +1,51 @@
+"""Smoke tests for the Qt theme token factories."""
+
+from __future__ import annotations
+
+import unittest
+from dataclasses import fields
+from pathlib import Path
+from types import ModuleType
+
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from interface.qt.styling.theme import Metrics, widget_tokens
+from interface.qt.styling.theme.metrics import build_metrics_for_ui_font
+
+
+class WidgetTokenFactoryTests(unittest.TestCase):
+    def _factories(self):
+        return [getattr(widget_tokens, name) for name in widget_tokens.__all__ if name.endswith("_tokens")]
+
+    def test_every_factory_builds_from_metrics(self) -> None:
+        for metrics in (Metrics(), build_metrics_for_ui_font(16)):
+            for factory in self._factories():
+                with self.subTest(factory=factory.__name__, font=metrics.font_size_medium):
+                    tokens = factory(metrics)
+                    names = getattr(tokens, "_fields", None) or [f.name for f in fields(tokens)]
+                    for name in names:
+                        self.assertIsNotNone(getattr(tokens, name))
+
+    def test_factories_are_cached_per_metrics_value(self) -> None:
+        for factory in self._factories():
+            with self.subTest(factory=factory.__name__):
+                self.assertIs(factory(Metrics()), factory(Metrics()))
+
+    def test_package_exports_are_the_submodule_objects(self) -> None:
+        for name in widget_tokens.__all__:
+            with self.subTest(name=name):
+                export = getattr(widget_tokens, name)
+                # Factories share their submodule's name; the export must not be the module.
+                self.assertNotIsInstance(export, ModuleType)
+                module = sys.modules[export.__module__]
+                self.assertEqual(module.__name__.rpartition(".")[0], widget_tokens.__name__)
+                self.assertIs(export, getattr(module, name))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
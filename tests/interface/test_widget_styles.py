@@ -0,0 +1,56 @@
+"""Tests for the QSS generator package and its helpers."""
+
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SRC_PATH = PROJECT_ROOT / "src"
+if str(SRC_PATH) not in sys.path:
+    sys.path.insert(0, str(SRC_PATH))
+
+from interface.qt.styling import widget_styles
+from interface.qt.styling.qss_builder import STYLE_MODULES
+from interface.qt.styling.qss_helpers import border_css
+
+
+class WidgetStylesPackageTests(unittest.TestCase):
+    def test_exports_are_unique(self) -> None:
+        self.assertEqual(len(set(widget_styles.__all__)), len(widget_styles.__all__))
+
+    def test_every_export_is_a_loaded_style_module(self) -> None:
+        for name in widget_styles.__all__:
+            with self.subTest(name=name):
+                module = getattr(widget_styles, name)
+                self.assertIs(module, sys.modules[f"{widget_styles.__name__}.{name}"])
+                self.assertTrue(callable(module.get_qss))
+
+    def test_qss_builder_uses_every_style_module(self) -> None:
+        self.assertEqual(
+            {module.__name__.rpartition(".")[2] for module in STYLE_MODULES},
+            set(widget_styles.__all__),
+        )
+
+
+class BorderCssTests(unittest.TestCase):
+    def test_equal_widths_collapse_to_shorthand(self) -> None:
+        self.assertEqual(border_css((1, 1, 1, 1), "#000"), "border: 1px solid #000;")
+
+    def test_mixed_widths_keep_one_declaration_per_side(self) -> None:
+        declarations = [line.strip() for line in border_css((0, 1, 2, 3), "red").splitlines()]
+        self.assertEqual(
+            declarations,
+            [
+                "border-top: 1px solid red;",
+                "border-bottom: 3px solid red;",
+                "border-left: 0px solid red;",
+                "border-right: 2px solid red;",
+            ],
+        )
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()